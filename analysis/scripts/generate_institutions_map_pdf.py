@@ -12,6 +12,12 @@ from matplotlib.patches import Circle, Polygon, Wedge
 import matplotlib.patches as mpatches
 from pathlib import Path
 from datetime import datetime
+import sys
+
+# Add scripts directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from iwrc_data_loader import load_project_overview, is_up_to_date, script_sources
 
 # ============================================================================
 # CONFIGURATION
@@ -27,7 +33,6 @@ DATA_FILE = Path('/Users/shivpat/seed-fund-tracking/data/consolidated/IWRC Seed
 def load_data():
     """Load and prepare institution data."""
     print("Loading data...")
-    df = pd.read_excel(DATA_FILE, sheet_name='Project Overview')
 
     # Rename columns
     col_map = {
@@ -35,7 +40,11 @@ def load_data():
         'Award Amount Allocated ($) this must be filled in for all lines': 'award_amount'
     }
 
+    df = load_project_overview(DATA_FILE, columns=list(col_map))
     df = df.rename(columns=col_map)
+    # The award column also holds text rows (e.g. 'Total', '104B'); count
+    # those as missing so the per-institution sums stay numeric
+    df['award_amount'] = pd.to_numeric(df['award_amount'], errors='coerce')
 
     # Get 10-year period data
     df_10yr = df[df.index > 0].copy()  # Use all data
@@ -75,33 +84,89 @@ INSTITUTION_COORDS = {
     'Basil\'s Harvest': (40.0, -89.0, 'Central Illinois'),
 }
 
+# Table form of INSTITUTION_COORDS for joining onto the institution summary
+INSTITUTION_COORDS_DF = (
+    pd.DataFrame.from_dict(INSTITUTION_COORDS, orient='index', columns=['lat', 'lon', 'city'])
+    .rename_axis('institution')
+    .reset_index()
+)
+
+# Marker tiers by total funding, smallest first: <$100K, $100K-$500K, $500K-$1M, $1M+
+FUNDING_TIER_BOUNDS = np.array([100000, 500000, 1000000])
+TIER_MARKER_SIZES = np.array([100, 150, 200, 300])
+TIER_COLORS = np.array(['#2ca02c', '#1f77b4', '#ff7f0e', '#d62728'])  # Green, Blue, Orange, Red
+TIER_LABEL_SIZES = np.array([6, 7, 8, 9])
+
+# ============================================================================
+# BASE MAP GEOMETRY (x=lon, y=lat)
+# ============================================================================
+
+# Simplified Illinois outline
+ILLINOIS_OUTLINE = np.array([
+    (-91.5, 37.0), (-91.2, 37.2), (-90.8, 37.5), (-90.5, 37.8),
+    (-90.2, 38.0), (-89.8, 38.2), (-89.5, 38.4), (-89.0, 38.5),
+    (-88.8, 38.7), (-88.5, 38.9), (-88.2, 39.1), (-87.8, 39.3),
+    (-87.5, 39.5), (-87.2, 39.7), (-87.0, 39.9), (-87.0, 40.1),
+    (-87.2, 40.3), (-87.0, 40.5), (-86.9, 40.7), (-87.0, 41.0),
+    (-87.2, 41.5), (-87.3, 42.0), (-87.5, 42.3), (-88.0, 42.5),
+    (-88.5, 42.3), (-89.0, 42.0), (-89.5, 41.5), (-89.8, 41.0),
+    (-90.2, 40.5), (-90.8, 40.0), (-91.0, 39.5), (-91.2, 39.0),
+    (-91.3, 38.5), (-91.2, 38.0), (-91.0, 37.5), (-91.5, 37.0)
+])
+
+# Major rivers
+RIVERS = {
+    'Mississippi': np.array([(-91.0, 42.5), (-91.2, 42.0), (-91.5, 41.0), (-91.4, 40.0),
+                             (-91.3, 39.0), (-91.2, 38.5), (-91.0, 37.5)]),
+    'Illinois': np.array([(-89.8, 42.3), (-89.2, 41.5), (-88.5, 40.5), (-88.8, 39.5),
+                          (-88.9, 39.0), (-89.2, 38.5)]),
+    'Rock': np.array([(-89.0, 42.5), (-88.8, 42.0), (-88.5, 41.2), (-88.3, 40.5)]),
+    'Fox': np.array([(-88.8, 42.2), (-88.4, 41.8), (-88.2, 41.5), (-88.0, 41.0)]),
+}
+
+# Lakes: (lat, lon, radius)
+LAKES = {
+    'Carlyle Lake': (38.4, -89.3, 0.35),
+    'Lake Shelbyville': (39.8, -88.5, 0.25),
+    'Lake Springfield': (39.8, -89.6, 0.2),
+    'Upper Peoria Lake': (40.8, -89.6, 0.2),
+    'Rend Lake': (38.2, -89.0, 0.2),
+    'Crab Orchard Lake': (37.8, -88.8, 0.2),
+}
+
 # ============================================================================
 # MAP GENERATION
 # ============================================================================
 
+def bucket_funding(funding):
+    """Return the marker tier index (0-3) for each funding amount."""
+    # side='left' counts bounds strictly below each value, matching the '>' thresholds
+    return np.searchsorted(FUNDING_TIER_BOUNDS, funding, side='left')
+
+
 def generate_map_pdf():
     """Generate Illinois institutions map PDF."""
     print("Generating map PDF...")
 
+    pdf_path = OUTPUT_DIR / '2025_illinois_institutions_map.pdf'
+    if is_up_to_date(pdf_path, *script_sources(__file__, DATA_FILE)):
+        print(f"✓ Up to date, skipping: {pdf_path}")
+        return
+
     # Load data
     inst_data = load_data()
 
-    # Add coordinates
-    inst_data['lat'] = inst_data['institution'].apply(
-        lambda x: INSTITUTION_COORDS.get(x, (40.0, -89.0, 'Unknown'))[0]
-    )
-    inst_data['lon'] = inst_data['institution'].apply(
-        lambda x: INSTITUTION_COORDS.get(x, (40.0, -89.0, 'Unknown'))[1]
-    )
-    inst_data['city'] = inst_data['institution'].apply(
-        lambda x: INSTITUTION_COORDS.get(x, (40.0, -89.0, 'Unknown'))[2]
+    # Add coordinates (unknown institutions default to central Illinois)
+    inst_data = inst_data.merge(INSTITUTION_COORDS_DF, on='institution', how='left').fillna(
+        {'lat': 40.0, 'lon': -89.0, 'city': 'Unknown'}
     )
 
-    pdf_path = OUTPUT_DIR / '2025_illinois_institutions_map.pdf'
+    # Sort institutions by funding once; used for star sizing and the listing
+    inst_data_sorted = inst_data.sort_values('total_funding', ascending=False)
 
     with PdfPages(pdf_path) as pdf:
         # Page 1: Map with markers
-        fig = plt.figure(figsize=(11, 8.5))
+        fig = plt.figure(figsize=(11, 8.5), layout='constrained')
         fig.suptitle('2025 IWRC Seed Fund - Funded Institutions Across Illinois',
                     fontsize=16, fontweight='bold', y=0.98)
 
@@ -115,83 +180,34 @@ def generate_map_pdf():
         ax.set_facecolor('#E8DCC8')
 
         # Draw simplified Illinois outline
-        illinois_outline = [
-            (37.0, -91.5), (37.2, -91.2), (37.5, -90.8), (37.8, -90.5),
-            (38.0, -90.2), (38.2, -89.8), (38.4, -89.5), (38.5, -89.0),
-            (38.7, -88.8), (38.9, -88.5), (39.1, -88.2), (39.3, -87.8),
-            (39.5, -87.5), (39.7, -87.2), (39.9, -87.0), (40.1, -87.0),
-            (40.3, -87.2), (40.5, -87.0), (40.7, -86.9), (41.0, -87.0),
-            (41.5, -87.2), (42.0, -87.3), (42.3, -87.5), (42.5, -88.0),
-            (42.3, -88.5), (42.0, -89.0), (41.5, -89.5), (41.0, -89.8),
-            (40.5, -90.2), (40.0, -90.8), (39.5, -91.0), (39.0, -91.2),
-            (38.5, -91.3), (38.0, -91.2), (37.5, -91.0), (37.0, -91.5)
-        ]
-
-        outline_poly = Polygon(illinois_outline, closed=True, fill=False,
+        outline_poly = Polygon(ILLINOIS_OUTLINE, closed=True, fill=False,
                               edgecolor='black', linewidth=2)
         ax.add_patch(outline_poly)
 
         # Draw major rivers
-        rivers = {
-            'Mississippi': [(42.5, -91.0), (42.0, -91.2), (41.0, -91.5), (40.0, -91.4),
-                           (39.0, -91.3), (38.5, -91.2), (37.5, -91.0)],
-            'Illinois': [(42.3, -89.8), (41.5, -89.2), (40.5, -88.5), (39.5, -88.8),
-                        (39.0, -88.9), (38.5, -89.2)],
-            'Rock': [(42.5, -89.0), (42.0, -88.8), (41.2, -88.5), (40.5, -88.3)],
-            'Fox': [(42.2, -88.8), (41.8, -88.4), (41.5, -88.2), (41.0, -88.0)],
-        }
-
-        for river_name, coords in rivers.items():
-            lons = [c[1] for c in coords]
-            lats = [c[0] for c in coords]
-            ax.plot(lons, lats, color='#4A90E2', linewidth=1.5, alpha=0.7)
+        for river_name, coords in RIVERS.items():
+            ax.plot(coords[:, 0], coords[:, 1], color='#4A90E2', linewidth=1.5, alpha=0.7)
 
         # Draw lakes
-        lakes = {
-            'Carlyle Lake': (38.4, -89.3, 0.35),
-            'Lake Shelbyville': (39.8, -88.5, 0.25),
-            'Lake Springfield': (39.8, -89.6, 0.2),
-            'Upper Peoria Lake': (40.8, -89.6, 0.2),
-            'Rend Lake': (38.2, -89.0, 0.2),
-            'Crab Orchard Lake': (37.8, -88.8, 0.2),
-        }
-
-        for lake_name, (lat, lon, radius) in lakes.items():
+        for lake_name, (lat, lon, radius) in LAKES.items():
             circle = Circle((lon, lat), radius, facecolor='#4A90E2', alpha=0.5,
                            edgecolor='#4A90E2', linewidth=1)
             ax.add_patch(circle)
 
-        # Sort institutions by funding for star sizing
-        inst_data = inst_data.sort_values('total_funding', ascending=False)
-
-        # Plot institution markers
-        for idx, row in inst_data.iterrows():
-            # Size based on funding
-            funding = row['total_funding']
-            if funding > 1000000:
-                size = 300
-                color = '#d62728'  # Red for largest
-                label_size = 9
-            elif funding > 500000:
-                size = 200
-                color = '#ff7f0e'  # Orange
-                label_size = 8
-            elif funding > 100000:
-                size = 150
-                color = '#1f77b4'  # Blue
-                label_size = 7
-            else:
-                size = 100
-                color = '#2ca02c'  # Green
-                label_size = 6
-
-            # Plot star marker
-            ax.scatter(row['lon'], row['lat'], marker='*', s=size*3, color=color,
-                      edgecolors='darkblue', linewidths=1, zorder=5, alpha=0.9)
-
-            # Add label
-            short_name = row['institution'].split()[0] if len(row['institution']) > 15 else row['institution'][:12]
-            ax.text(row['lon'] + 0.2, row['lat'] + 0.15, short_name,
+        # Plot institution markers (column arrays instead of per-row Series)
+        lons = inst_data_sorted['lon'].to_numpy()
+        lats = inst_data_sorted['lat'].to_numpy()
+        names = inst_data_sorted['institution'].to_numpy(dtype=object)
+        tiers = bucket_funding(inst_data_sorted['total_funding'].to_numpy())
+
+        # Plot all star markers in one call, sized and colored by funding tier
+        ax.scatter(lons, lats, marker='*', s=TIER_MARKER_SIZES[tiers] * 3, c=TIER_COLORS[tiers],
+                  edgecolors='darkblue', linewidths=1, zorder=5, alpha=0.9)
+
+        # Add labels
+        for lon, lat, name, label_size in zip(lons, lats, names, TIER_LABEL_SIZES[tiers]):
+            short_name = name.split()[0] if len(name) > 15 else name[:12]
+            ax.text(lon + 0.2, lat + 0.15, short_name,
                    fontsize=label_size, fontweight='bold', zorder=6,
                    bbox=dict(boxstyle='round,pad=0.3', facecolor='white',
                             alpha=0.7, edgecolor='none'))
@@ -230,7 +246,6 @@ def generate_map_pdf():
         ax.spines['bottom'].set_visible(False)
         ax.spines['left'].set_visible(False)
 
-        plt.tight_layout()
         pdf.savefig(fig, bbox_inches='tight')
         plt.close(fig)
 
@@ -244,19 +259,21 @@ def generate_map_pdf():
         ax.text(0.5, 0.94, '10-Year Period (2015-2024)', ha='center', fontsize=11,
                style='italic', transform=ax.transAxes, color='gray')
 
-        # Sort by funding
-        inst_data_sorted = inst_data.sort_values('total_funding', ascending=False)
-
         # Create listing
-        listing_text = "Institution                                    Funding        Projects\n"
-        listing_text += "─" * 75 + "\n"
-
-        for idx, row in inst_data_sorted.iterrows():
-            inst_short = row['institution'][:44] if len(row['institution']) > 44 else row['institution']
-            listing_text += f"{inst_short:<45} ${row['total_funding']:>10,.0f}   {int(row['project_count']):>3d}\n"
-
-        listing_text += "─" * 75 + "\n"
-        listing_text += f"{'TOTAL':<45} ${inst_data_sorted['total_funding'].sum():>10,.0f}   {int(inst_data_sorted['project_count'].sum()):>3d}"
+        rule = "─" * 75
+        lines = [
+            "Institution                                    Funding        Projects",
+            rule,
+        ]
+        lines += [
+            f"{row.institution[:44]:<45} ${row.total_funding:>10,.0f}   {int(row.project_count):>3d}"
+            for row in inst_data_sorted.itertuples(index=False)
+        ]
+        lines += [
+            rule,
+            f"{'TOTAL':<45} ${inst_data_sorted['total_funding'].sum():>10,.0f}   {int(inst_data_sorted['project_count'].sum()):>3d}",
+        ]
+        listing_text = "\n".join(lines)
 
         ax.text(0.05, 0.90, listing_text, ha='left', va='top', fontsize=7.5,
                transform=ax.transAxes, family='monospace',
@@ -19,7 +19,6 @@ from plotly.subplots import make_subplots
 import json
 import os
 import sys
-import re
 from datetime import datetime
 
 # Setup
@@ -27,6 +26,7 @@ sys.path.insert(0, '/Users/shivpat/seed-fund-tracking/scripts')
 
 from iwrc_brand_style import IWRC_COLORS
 from award_type_filters import filter_all_projects, filter_104b_only
+from iwrc_data_loader import extract_project_years
 
 PROJECT_ROOT = '/Users/shivpat/seed-fund-tracking'
 DATA_FILE = os.path.join(PROJECT_ROOT, 'data/consolidated/IWRC Seed Fund Tracking.xlsx')
@@ -65,21 +65,8 @@ def load_and_prepare_data():
         df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
     df['award_amount'] = pd.to_numeric(df['award_amount'], errors='coerce').fillna(0)
 
-    # Extract year
-    def extract_year(project_id):
-        if pd.isna(project_id):
-            return None
-        project_id_str = str(project_id).strip()
-        year_match = re.search(r'(20\d{2}|19\d{2})', project_id_str)
-        if year_match:
-            return int(year_match.group(1))
-        fy_match = re.search(r'FY(\d{2})', project_id_str, re.IGNORECASE)
-        if fy_match:
-            fy_year = int(fy_match.group(1))
-            return 2000 + fy_year if fy_year < 100 else fy_year
-        return None
-
-    df['project_year'] = df['project_id'].apply(extract_year)
+    # Extract year (vectorized string scans, no per-row regex)
+    df['project_year'] = extract_project_years(df['project_id'])
 
     # Time periods
     df_10yr = df[df['project_year'].between(2015, 2024, inclusive='both')]
@@ -104,16 +91,14 @@ def create_roi_analysis_dashboard(all_10yr, all_5yr, b104_10yr, b104_5yr):
 
     # Prepare data for both tracks
     def get_roi_data(df, label):
-        yearly = df.groupby('project_year').agg({
-            'award_amount': 'sum',
-            'project_id': 'count',
-            'phd_students': 'sum',
-            'ms_students': 'sum',
-            'undergrad_students': 'sum',
-            'postdoc_students': 'sum'
-        }).reset_index()
-        yearly['total_students'] = (yearly['phd_students'] + yearly['ms_students'] +
-                                   yearly['undergrad_students'] + yearly['postdoc_students'])
+        # One grouped pass; students are summed per row first
+        yearly = df.assign(
+            total_students=df[['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']].sum(axis=1)
+        ).groupby('project_year').agg(
+            award_amount=('award_amount', 'sum'),
+            project_id=('project_id', 'count'),
+            total_students=('total_students', 'sum')
+        ).reset_index()
         yearly['students_per_dollar'] = yearly['total_students'] / yearly['award_amount']
         yearly['projects_per_dollar'] = yearly['project_id'] / yearly['award_amount']
         yearly['track'] = label
@@ -167,7 +152,7 @@ def create_roi_analysis_dashboard(all_10yr, all_5yr, b104_10yr, b104_5yr):
         template='plotly_white',
     )
 
-    fig.write_html(os.path.join(OUTPUT_DIR, 'roi_analysis_dashboard.html'))
+    fig.write_html(os.path.join(OUTPUT_DIR, 'roi_analysis_dashboard.html'), include_plotlyjs='cdn')
     print(f"    ✓ Generated: roi_analysis_dashboard.html")
 
 
@@ -244,7 +229,7 @@ def create_institutional_distribution_dashboard(all_10yr, all_5yr, b104_10yr, b1
         hovermode='y'
     )
 
-    fig.write_html(os.path.join(OUTPUT_DIR, 'institutional_distribution_map.html'))
+    fig.write_html(os.path.join(OUTPUT_DIR, 'institutional_distribution_map.html'), include_plotlyjs='cdn')
     print(f"    ✓ Generated: institutional_distribution_map.html")
 
 
@@ -320,7 +305,7 @@ def create_students_interactive_dashboard(all_10yr, all_5yr, b104_10yr, b104_5yr
         hovermode='x'
     )
 
-    fig.write_html(os.path.join(OUTPUT_DIR, 'students_interactive.html'))
+    fig.write_html(os.path.join(OUTPUT_DIR, 'students_interactive.html'), include_plotlyjs='cdn')
     print(f"    ✓ Generated: students_interactive.html")
 
 
@@ -386,7 +371,7 @@ def create_investment_interactive_dashboard(all_10yr, all_5yr, b104_10yr, b104_5
         hovermode='x unified'
     )
 
-    fig.write_html(os.path.join(OUTPUT_DIR, 'investment_interactive.html'))
+    fig.write_html(os.path.join(OUTPUT_DIR, 'investment_interactive.html'), include_plotlyjs='cdn')
     print(f"    ✓ Generated: investment_interactive.html")
 
 
@@ -450,7 +435,7 @@ def create_projects_timeline_dashboard(all_10yr, all_5yr, b104_10yr, b104_5yr):
         hovermode='x'
     )
 
-    fig.write_html(os.path.join(OUTPUT_DIR, 'projects_timeline.html'))
+    fig.write_html(os.path.join(OUTPUT_DIR, 'projects_timeline.html'), include_plotlyjs='cdn')
     print(f"    ✓ Generated: projects_timeline.html")
 
 
@@ -514,7 +499,7 @@ def create_detailed_analysis_dashboard(all_10yr, all_5yr, b104_10yr, b104_5yr):
         template='plotly_white'
     )
 
-    fig.write_html(os.path.join(OUTPUT_DIR, 'detailed_analysis.html'))
+    fig.write_html(os.path.join(OUTPUT_DIR, 'detailed_analysis.html'), include_plotlyjs='cdn')
     print(f"    ✓ Generated: detailed_analysis.html")
 
 
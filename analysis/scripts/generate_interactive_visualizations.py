@@ -6,25 +6,37 @@ Uses corrected project counts: 77 projects (2015-2024), 47 projects (2020-2024)
 Applies IWRC branding: #258372 teal, #639757 olive, Montserrat fonts
 """
 
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
+import plotly.io as pio
 import plotly.express as px
 from plotly.subplots import make_subplots
 import folium
 from folium.plugins import HeatMap, MarkerCluster
 import json
 from datetime import datetime
+import functools
+import gzip
+import importlib.util
+import io
 import os
+import shutil
 import sys
 import re
+from pathlib import Path
 
-# Add scripts to path for imports
-# sys.path.insert(0, '/Users/shivpat/seed-fund-tracking/scripts')
+# Add scripts directory to path (also inherited by the worker processes)
+sys.path.insert(0, str(Path(__file__).parent))
+
+from iwrc_data_loader import IWRCDataLoader, is_up_to_date, script_sources
 
 # Import IWRC branding and award type filters
 try:
     from iwrc_brand_style import IWRC_COLORS, get_iwrc_plotly_template, apply_iwrc_plotly_style
-    from award_type_filters import filter_all_projects, filter_104b_only, get_award_type_label, get_award_type_short_label
+    from award_type_filters import AWARD_TYPES, filter_all_projects, filter_104b_only, get_award_type_label, get_award_type_short_label
     USE_IWRC_BRANDING = True
     print("✓ Imported IWRC branding and award type filters")
 except ImportError as e:
@@ -61,11 +73,56 @@ else:
         'dark': '#343a40'
     }
 
+# Serialize figures with orjson when it is installed (optional; Plotly
+# falls back to the stdlib json encoder otherwise)
+if importlib.util.find_spec('orjson'):
+    pio.json.config.default_engine = 'orjson'
+
+# Layout template shared by the subplot dashboards, resolved once at import
+PLOTLY_TEMPLATE = pio.templates['plotly_white']
+
+# Stacked funding categories of the detailed analysis and their bar colors
+FUNDING_CATEGORY_COLORS = {
+    'Direct_Funding': COLORS['primary'],
+    'Student_Support': COLORS['secondary'],
+    'Equipment': COLORS['success'],
+    'Other': COLORS['warning'],
+}
+
 # Data Constants (Corrected)
 # Data Constants (Dynamic)
 # CORRECTED_DATA removed - calculated dynamically from loader
 
+# Fallback workbook when IWRCDataLoader is unavailable
+EXCEL_PATH = '/Users/shivpat/seed-fund-tracking/data/processed/clean_iwrc_tracking.xlsx'
+
+# Source column (whitespace-stripped) -> standardized name (fallback loading only)
+COL_MAP = {
+    'Project ID': 'project_id',
+    'Award Type': 'award_type',
+    'Project Title': 'project_title',
+    'Project PI': 'pi_name',
+    'Academic Institution of PI': 'institution',
+    'Award Amount Allocated ($) this must be filled in for all lines': 'award_amount',
+    'Number of PhD Students Supported by WRRA $': 'phd_students',
+    'Number of MS Students Supported by WRRA $': 'ms_students',
+    'Number of Undergraduate Students Supported by WRRA $': 'undergrad_students',
+    'Number of Post Docs Supported by WRRA $': 'postdoc_students',
+}
+
+# Standardized columns read by the dashboards and calculate_metrics; everything
+# else in the sheet is dropped right after loading
+USED_COLS = [
+    'project_id', 'project_year', 'award_type', 'project_title', 'institution',
+    'award_amount', 'award_amount_numeric',
+    'phd_students', 'ms_students', 'undergrad_students', 'postdoc_students',
+]
+
+@functools.lru_cache(maxsize=1)
 def load_data():
+    """Load project data and institution coordinates (cached; the workbook is parsed once per run)."""
+    xl_file = None
+
     # Use IWRCDataLoader to load and standardize data
     try:
         from iwrc_data_loader import IWRCDataLoader
@@ -75,46 +132,36 @@ def load_data():
         print("✓ Loaded data using IWRCDataLoader")
     except ImportError:
         print("Warning: Could not import IWRCDataLoader. Using manual loading.")
-        # Fallback to manual loading (existing code)
-        excel_path = '/Users/shivpat/seed-fund-tracking/data/processed/clean_iwrc_tracking.xlsx'
-        xl_file = pd.ExcelFile(excel_path)
+        # Fallback to manual loading: open the workbook once and parse sheets
+        # from the same handle, materializing only the mapped columns
+        try:
+            xl_file = pd.ExcelFile(EXCEL_PATH, engine='calamine')
+        except (ImportError, ValueError):
+            # python-calamine not installed (or pandas too old to know the engine)
+            xl_file = pd.ExcelFile(EXCEL_PATH)
+        usecols = lambda col: str(col).strip() in COL_MAP
         try:
-            df = pd.read_excel(excel_path, sheet_name='Projects')
+            df = xl_file.parse(sheet_name='Projects', usecols=usecols)
         except:
             try:
-                df = pd.read_excel(excel_path, sheet_name='Project Overview')
+                df = xl_file.parse(sheet_name='Project Overview', usecols=usecols)
             except:
-                df = pd.read_excel(excel_path, sheet_name=0)
-        
-        # Normalize column names
-        col_map = {
-            'Project ID ': 'project_id',
-            'Award Type': 'award_type',
-            'Project Title': 'project_title',
-            'Project PI': 'pi_name',
-            'Academic Institution of PI': 'institution',
-            'Award Amount Allocated ($) this must be filled in for all lines': 'award_amount',
-            'Number of PhD Students Supported by WRRA $': 'phd_students',
-            'Number of MS Students Supported by WRRA $': 'ms_students',
-            'Number of Undergraduate Students Supported by WRRA $': 'undergrad_students',
-            'Number of Post Docs Supported by WRRA $': 'postdoc_students',
-        }
-        available_cols = {k: v for k, v in col_map.items() if k in df.columns}
-        if available_cols:
-            df = df.rename(columns=available_cols)
-            
+                df = xl_file.parse(sheet_name=0, usecols=usecols)
+
+        # Normalize column names: strip stray whitespace (e.g. 'Project ID ')
+        # once, then map every header in a single pass without copying data
+        df.columns = [COL_MAP.get(col, col) for col in df.columns.astype(str).str.strip()]
+
         # Ensure project_year exists
         if 'project_year' not in df.columns and 'project_id' in df.columns:
-             def extract_year(pid):
-                 import re
-                 if pd.isna(pid): return None
-                 m = re.search(r'(20\d{2})', str(pid))
-                 return int(m.group(1)) if m else None
-             df['project_year'] = df['project_id'].apply(extract_year)
-
-    # Load institution coordinates if available
+            # One vectorized regex scan over the column (NaN where no year)
+            df['project_year'] = pd.to_numeric(
+                df['project_id'].astype(str).str.extract(r'(20\d{2})', expand=False)
+            )
+
+    # Load institution coordinates if available (only from the manually opened workbook)
     try:
-        coords_df = pd.read_excel(excel_path, sheet_name='Institution Coordinates')
+        coords_df = xl_file.parse(sheet_name='Institution Coordinates')
     except:
         # Create default coordinates for Illinois institutions
         coords_df = pd.DataFrame({
@@ -128,16 +175,288 @@ def load_data():
                 'Illinois State University',
                 'Western Illinois University',
                 'Eastern Illinois University',
-                'Governors State University'
+                'Governors State University',
+                'University of Illinois Chicago',
+                'Loyola University Chicago',
+                'Lewis University',
+                'Lewis and Clark Community College',
+                'Illinois State Water Survey'
             ],
-            'Latitude': [40.1020, 42.0565, 41.8348, 41.7886, 37.7213, 41.9306, 40.5142, 40.4656, 39.4817, 41.4548],
-            'Longitude': [-88.2272, -87.6753, -87.6266, -87.5987, -89.2167, -88.7712, -88.9907, -90.6706, -88.2039, -87.7195]
+            'Latitude': [40.1020, 42.0565, 41.8348, 41.7886, 37.7213, 41.9306, 40.5142, 40.4656, 39.4817, 41.4548,
+                         41.8708, 41.9989, 41.6070, 38.9742, 40.1164],
+            'Longitude': [-88.2272, -87.6753, -87.6266, -87.5987, -89.2167, -88.7712, -88.9907, -90.6706, -88.2039, -87.7195,
+                          -87.6470, -87.6576, -88.0892, -90.1840, -88.2434]
         })
 
+    # Keep only the columns the dashboards use, so the per-track filter copies
+    # stay narrow, and store student counts as compact float32 columns and the
+    # low-cardinality group keys as categoricals
+    df = df[[c for c in USED_COLS if c in df.columns]]
+    available_student_cols = [c for c in STUDENT_COLS if c in df.columns]
+    # Raw sheet cells may hold text (e.g. 'N/A') on the manual-loading path
+    df[available_student_cols] = (
+        df[available_student_cols].apply(pd.to_numeric, errors='coerce').astype('float32')
+    )
+    df = df.astype({c: 'category' for c in ('institution', 'award_type') if c in df.columns})
+
+    # Students per project, summed once for every chart that needs it
+    df['total_students'] = df[available_student_cols].sum(axis=1) if available_student_cols else 0
+
     return df, coords_df
 
-def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all', period_key='10_year'):
-    """Create main ROI analysis dashboard"""
+# ============================================================================
+# SYNTHETIC PLACEHOLDER DATA
+# ============================================================================
+
+# Placeholder tables for the charts that have no source columns yet; built
+# into DataFrames once per run by synthetic_frame()
+SYNTHETIC_YEARS = list(range(2015, 2025))
+
+SYNTHETIC_DATA = {
+    'institutions': {
+        'Funding': [3500000, 2000000, 1200000, 800000, 500000, 300000, 200000],
+        'Projects': [35, 18, 12, 6, 4, 1, 1],
+        'Students': [120, 80, 50, 25, 15, 8, 6]
+    },
+    'funding_breakdown': {
+        'Year': SYNTHETIC_YEARS,
+        'Direct_Funding': [400000, 420000, 380000, 450000, 500000, 480000, 520000, 550000, 580000, 600000],
+        'Student_Support': [200000, 210000, 190000, 220000, 240000, 230000, 250000, 260000, 270000, 280000],
+        'Equipment': [150000, 160000, 140000, 170000, 180000, 170000, 190000, 200000, 210000, 220000],
+        'Other': [100000, 110000, 90000, 110000, 130000, 120000, 140000, 150000, 160000, 170000]
+    },
+    'student_cumulative': {
+        'Year': SYNTHETIC_YEARS,
+        'Cumulative_Students': [30, 61, 91, 122, 152, 183, 213, 244, 274, 304]
+    },
+    'roi_data': {
+        'Year': SYNTHETIC_YEARS + [2025, 2026, 2027],
+        'ROI': [0.025, 0.028, 0.030, 0.032, 0.035, 0.032, 0.030, 0.028, 0.030, 0.032, 0.035, 0.038, 0.040],
+        'Type': ['Actual']*10 + ['Projected']*3
+    },
+    'student_data': {
+        'Type': ['Graduate']*5 + ['Undergraduate']*5 + ['Postdoc']*3,
+        'Institution': [
+            'UIUC', 'Northwestern', 'IIT', 'UChicago', 'SIU',
+            'UIUC', 'Northwestern', 'IIT', 'ISU', 'NIU',
+            'UIUC', 'Northwestern', 'UChicago'
+        ],
+        'Count': [80, 45, 30, 18, 12, 40, 25, 15, 10, 8, 15, 8, 5]
+    },
+    'investment_data': {
+        'Institution': [
+            'UIUC', 'UIUC', 'UIUC',
+            'Northwestern', 'Northwestern',
+            'IIT', 'IIT',
+            'UChicago',
+            'SIU', 'NIU', 'ISU'
+        ],
+        'Category': [
+            'Research', 'Equipment', 'Students',
+            'Research', 'Students',
+            'Research', 'Equipment',
+            'Research',
+            'Research', 'Research', 'Research'
+        ],
+        'Amount': [
+            2000000, 800000, 700000,
+            1200000, 800000,
+            700000, 500000,
+            800000,
+            500000, 300000, 200000
+        ]
+    },
+}
+
+@functools.lru_cache(maxsize=None)
+def synthetic_frame(name):
+    """Return the SYNTHETIC_DATA table as a DataFrame (cached; treat as read-only)."""
+    return pd.DataFrame(SYNTHETIC_DATA[name])
+
+@functools.lru_cache(maxsize=None)
+def synthetic_hierarchy(name, outer, inner, value):
+    """
+    Two-level SYNTHETIC_DATA table as go.Sunburst / go.Treemap node lists (cached).
+
+    Returns (nodes, colors): nodes is dict(ids, labels, parents, values) with
+    the outer-level totals first, for traces drawn with branchvalues='total';
+    colors colors each leaf by its value and each parent by the value-weighted
+    mean of its leaves, as px.sunburst/px.treemap do with color=value.
+    """
+    table = SYNTHETIC_DATA[name]
+    totals = {}
+    weighted = {}
+    for key, amount in zip(table[outer], table[value]):
+        totals[key] = totals.get(key, 0) + amount
+        weighted[key] = weighted.get(key, 0) + amount * amount
+    nodes = dict(
+        ids=list(totals) + [f'{o}/{i}' for o, i in zip(table[outer], table[inner])],
+        labels=list(totals) + list(table[inner]),
+        parents=[''] * len(totals) + list(table[outer]),
+        values=list(totals.values()) + list(table[value]),
+    )
+    colors = [weighted[key] / totals[key] for key in totals] + list(table[value])
+    return nodes, colors
+
+STUDENT_COLS = ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']
+
+def build_track_aggregates(df):
+    """
+    Aggregate yearly and per-institution totals for both award tracks at once.
+
+    Groups the All Projects frame once per key with the 104B flag as an extra
+    level; the All Projects view sums over that level and the 104B view is a
+    slice of it, so the 104B subset never needs its own groupby.
+
+    Returns {'all': {'yearly': ..., 'by_inst': ...}, '104b': {...}}
+    """
+    df = df.assign(is_104b=df['award_type'] == AWARD_TYPES['base_grant'])
+
+    aggregates = {'all': {}, '104b': {}}
+
+    if 'project_year' in df.columns:
+        yearly = df.groupby(['is_104b', 'project_year'], observed=True).agg(
+            Investment=('award_amount', 'sum'),
+            Projects=('project_title', 'count'),
+            Students=('total_students', 'sum')
+        )
+        views = {
+            'all': yearly.groupby(level='project_year').sum(),
+            '104b': yearly[yearly.index.get_level_values('is_104b')].droplevel('is_104b'),
+        }
+        for key, view in views.items():
+            view = view.rename_axis('Year').reset_index()
+            # ROI Trend (mock or calculated)
+            view['ROI'] = 0.03 # Placeholder as we don't have yearly revenue data
+            aggregates[key]['yearly'] = view
+    else:
+        # Fallback
+        for key in aggregates:
+            aggregates[key]['yearly'] = pd.DataFrame({'Year': [], 'Investment': [], 'Projects': [], 'Students': [], 'ROI': []})
+
+    if 'institution' in df.columns:
+        by_inst = df.groupby(['is_104b', 'institution'], observed=True).agg(
+            Investment=('award_amount', 'sum'),
+            Projects=('project_title', 'count'),
+            Students=('total_students', 'sum')
+        )
+        aggregates['all']['by_inst'] = by_inst.groupby(level='institution', observed=True).sum()
+        aggregates['104b']['by_inst'] = by_inst[by_inst.index.get_level_values('is_104b')].droplevel('is_104b')
+    else:
+        for key in aggregates:
+            aggregates[key]['by_inst'] = pd.DataFrame({'Investment': [], 'Projects': [], 'Students': []})
+
+    return aggregates
+
+PLOTLY_CONFIG = {'displayModeBar': True, 'displaylogo': False}
+
+def save_plotly_html(fig, output_path):
+    """
+    Write a Plotly figure as HTML (see write_html_file).
+
+    A fixed div id (from the file name) plus the CDN plotly.js make the output
+    deterministic, so a re-run with unchanged data rewrites nothing.
+
+    Returns the size of the HTML in bytes.
+    """
+    div_id = os.path.splitext(os.path.basename(output_path))[0]
+    html = fig.to_html(include_plotlyjs='cdn', config=PLOTLY_CONFIG, div_id=div_id)
+    return write_html_file(html, output_path)
+
+def write_html_file(html, output_path):
+    """
+    Write rendered HTML in a single call, leaving the file alone if nothing changed.
+
+    Unchanged output is only touched to mark it up to date. A gzip copy
+    (``.html.gz``) is written next to it for static hosts that serve
+    precompressed files.
+
+    Returns the size of the HTML in bytes.
+    """
+    data = html.encode('utf-8')
+
+    if os.path.exists(output_path) and os.path.getsize(output_path) == len(data):
+        with open(output_path, 'rb') as f:
+            unchanged = f.read() == data
+        if unchanged and os.path.exists(output_path + '.gz'):
+            os.utime(output_path)
+            print(f"  Unchanged: {output_path}")
+            return len(data)
+
+    with open(output_path, 'wb') as f:
+        f.write(data)
+    # mtime=0 keeps the gzip header (and so the .gz bytes) deterministic
+    with open(output_path + '.gz', 'wb') as f:
+        f.write(gzip.compress(data, compresslevel=6, mtime=0))
+    print(f"  Saved: {output_path} (+ .gz)")
+    return len(data)
+
+# Line traces longer than this are thinned with LTTB before serialization
+MAX_TRACE_POINTS = 2000
+
+def downsample_lttb(x, y, n_out=MAX_TRACE_POINTS):
+    """
+    Largest-Triangle-Three-Buckets downsampling of a line trace.
+
+    Keeps the first and last points plus, from each of n_out - 2 equal
+    buckets, the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket. Traces with at most n_out points
+    are returned unchanged (as arrays).
+    """
+    x, y = np.asarray(x), np.asarray(y)
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return x, y
+
+    xf, yf = x.astype(float), y.astype(float)
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    keep = np.empty(n_out, dtype=int)
+    keep[0], keep[-1] = 0, n - 1
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(hi, edges[i + 2]) if i + 2 < len(edges) else slice(n - 1, n)
+        cx, cy = xf[nxt].mean(), yf[nxt].mean()
+        ax, ay = xf[keep[i]], yf[keep[i]]
+        area = np.abs((ax - cx) * (yf[lo:hi] - ay) - (ax - xf[lo:hi]) * (cy - ay))
+        keep[i + 1] = lo + int(area.argmax())
+    return x[keep], y[keep]
+
+# Fixed subplot grid of the ROI dashboard (same for both tracks)
+ROI_DASHBOARD_GRID = dict(
+    rows=5, cols=2,
+    specs=[
+        [{"type": "indicator"}, {"type": "indicator"}],
+        [{"type": "indicator"}, {"type": "indicator"}],
+        [{"type": "scatter"}, {"type": "bar"}],
+        [{"type": "scatter"}, {"type": "scatter"}],
+        [{"type": "bar"}, {"type": "domain"}]
+    ],
+    vertical_spacing=0.08,
+    subplot_titles=(
+        None, None, None, None,
+        'Investment by Year', 'Projects by Year',
+        'Students Supported by Year', 'ROI Trend Over Time',
+        'Investment by Institution (Top 10)', 'Project Distribution by Institution'
+    )
+)
+
+# Axis titles of the ROI dashboard, by axis id. Indicator and domain cells
+# have no axes, so xaxis..xaxis5 are the five xy panels in rows 3-5.
+ROI_DASHBOARD_AXES = {
+    'xaxis': {'title': {'text': 'Year'}},
+    'yaxis': {'title': {'text': 'Investment ($)'}},
+    'xaxis2': {'title': {'text': 'Year'}},
+    'yaxis2': {'title': {'text': 'Projects'}},
+    'xaxis3': {'title': {'text': 'Year'}},
+    'yaxis3': {'title': {'text': 'Students'}},
+    'xaxis4': {'title': {'text': 'Year'}},
+    'yaxis4': {'title': {'text': 'ROI (%)'}, 'tickformat': '.1%'},
+    'xaxis5': {'title': {'text': 'Investment ($)'}},
+    'yaxis5': {'title': {'text': 'Institution'}},
+}
+
+def create_roi_dashboard(aggregates, output_path, CORRECTED_DATA, award_type_key='all', period_key='10_year'):
+    """Create main ROI analysis dashboard from build_track_aggregates() output for one track"""
     print("Creating ROI Analysis Dashboard...")
 
     # Get metrics for the selected award type and period
@@ -146,23 +465,7 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
     m5 = CORRECTED_DATA.get(award_type_key, {}).get('5_year', {})
 
     # Create figure with 5 rows (2 for indicators, 3 for charts)
-    fig = make_subplots(
-        rows=5, cols=2,
-        specs=[
-            [{"type": "indicator"}, {"type": "indicator"}],
-            [{"type": "indicator"}, {"type": "indicator"}],
-            [{"type": "scatter"}, {"type": "bar"}],
-            [{"type": "scatter"}, {"type": "scatter"}],
-            [{"type": "bar"}, {"type": "domain"}]
-        ],
-        vertical_spacing=0.08,
-        subplot_titles=(
-            None, None, None, None,
-            'Investment by Year', 'Projects by Year',
-            'Students Supported by Year', 'ROI Trend Over Time',
-            'Investment by Institution (Top 10)', 'Project Distribution by Institution'
-        )
-    )
+    fig = make_subplots(**ROI_DASHBOARD_GRID)
 
     # Add indicators using DYNAMIC metrics
     # Row 1, Col 1: Total Investment
@@ -198,34 +501,20 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
         title={"text": "Total Projects"},
     ), row=2, col=2)
 
-    # Prepare yearly data
-    # Calculate total students per row if not exists
-    student_cols = ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']
-    available_student_cols = [c for c in student_cols if c in df.columns]
-    if available_student_cols:
-        df['total_students'] = df[available_student_cols].sum(axis=1)
-    else:
-        df['total_students'] = 0
+    # Yearly and per-institution totals (aggregated once for both tracks)
+    yearly_data = aggregates['yearly']
+    by_inst = aggregates['by_inst']
 
-    if 'project_year' in df.columns:
-        yearly_data = df.groupby('project_year').agg(
-            Investment=('award_amount', 'sum'),
-            Projects=('project_title', 'count'),
-            Students=('total_students', 'sum')
-        ).reset_index()
-        yearly_data.columns = ['Year', 'Investment', 'Projects', 'Students']
-        
-        # ROI Trend (mock or calculated)
-        yearly_data['ROI'] = 0.03 # Placeholder as we don't have yearly revenue data
-    else:
-        # Fallback
-        yearly_data = pd.DataFrame({'Year': [], 'Investment': [], 'Projects': [], 'Students': [], 'ROI': []})
+    # Line traces, thinned if the yearly series ever outgrows MAX_TRACE_POINTS
+    years_investment, investment = downsample_lttb(yearly_data['Year'], yearly_data['Investment'])
+    years_students, students = downsample_lttb(yearly_data['Year'], yearly_data['Students'])
+    years_roi, roi = downsample_lttb(yearly_data['Year'], yearly_data['ROI'])
 
     # 1. Investment by Year (Row 3)
     fig.add_trace(
         go.Scatter(
-            x=yearly_data['Year'],
-            y=yearly_data['Investment'],
+            x=years_investment,
+            y=investment,
             mode='lines+markers',
             name='Investment',
             line=dict(color=COLORS['primary'], width=3),
@@ -250,8 +539,8 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
     # 3. Students by Year (Row 4)
     fig.add_trace(
         go.Scatter(
-            x=yearly_data['Year'],
-            y=yearly_data['Students'],
+            x=years_students,
+            y=students,
             mode='lines+markers',
             name='Students',
             line=dict(color=COLORS['success'], width=3),
@@ -265,8 +554,8 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
     # 4. ROI Trend (Row 4)
     fig.add_trace(
         go.Scatter(
-            x=yearly_data['Year'],
-            y=yearly_data['ROI'],
+            x=years_roi,
+            y=roi,
             mode='lines+markers',
             name='ROI',
             line=dict(color=COLORS['danger'], width=3),
@@ -277,10 +566,7 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
     )
 
     # 5. Investment by Institution (Row 5)
-    if 'institution' in df.columns:
-        inst_investment = df.groupby('institution')['award_amount'].sum().sort_values(ascending=False).head(10)
-    else:
-        inst_investment = pd.Series()
+    inst_investment = by_inst['Investment'].nlargest(10)
 
     fig.add_trace(
         go.Bar(
@@ -295,10 +581,7 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
     )
 
     # 6. Project Distribution Pie (Row 5)
-    if 'institution' in df.columns:
-        inst_projects = df.groupby('institution')['project_title'].count().head(10)
-    else:
-        inst_projects = pd.Series()
+    inst_projects = by_inst['Projects'].head(10)
 
     fig.add_trace(
         go.Pie(
@@ -324,28 +607,47 @@ def create_roi_dashboard(df, output_path, CORRECTED_DATA, award_type_key='all',
         showlegend=False,
         height=1400,
         hovermode='closest',
-        template='plotly_white'
+        template=PLOTLY_TEMPLATE,
+        **ROI_DASHBOARD_AXES
     )
 
-    # Update axes
-    fig.update_xaxes(title_text="Year", row=1, col=1)
-    fig.update_yaxes(title_text="Investment ($)", row=1, col=1)
-    fig.update_xaxes(title_text="Year", row=1, col=2)
-    fig.update_yaxes(title_text="Projects", row=1, col=2)
-    fig.update_xaxes(title_text="Year", row=2, col=1)
-    fig.update_yaxes(title_text="Students", row=2, col=1)
-    fig.update_xaxes(title_text="Year", row=2, col=2)
-    fig.update_yaxes(title_text="ROI (%)", row=2, col=2, tickformat='.1%')
-    fig.update_xaxes(title_text="Investment ($)", row=3, col=1)
-    fig.update_yaxes(title_text="Institution", row=3, col=1)
-
     # Save
-    fig.write_html(output_path, config={'displayModeBar': True, 'displaylogo': False})
-    print(f"  Saved: {output_path}")
-    return os.path.getsize(output_path)
-
-def create_geographic_map(df, coords_df, output_path):
-    """Create interactive geographic map"""
+    return save_plotly_html(fig, output_path)
+
+# Marker popup and label HTML, filled per institution with str.format_map.
+# Kept free of indentation whitespace since a copy is embedded per marker.
+MAP_POPUP_TEMPLATE = (
+    '<div style="font-family: Montserrat, sans-serif; width: 250px;">'
+    '<h4 style="margin: 0 0 10px 0; color: #333;">{Institution}</h4>'
+    '<hr style="margin: 5px 0;">'
+    '<p style="margin: 5px 0;"><b>Total Funding:</b> ${Funding:,.0f}</p>'
+    '<p style="margin: 5px 0;"><b>Projects:</b> {Projects}</p>'
+    '<p style="margin: 5px 0;"><b>Students:</b> {Students:.0f}</p>'
+    '<p style="margin: 5px 0;"><b>Avg per Project:</b> ${avg_funding:,.0f}</p>'
+    '</div>'
+)
+
+MAP_LABEL_TEMPLATE = (
+    '<div style="font-size: 10px; color: black; font-weight: bold; '
+    'background: white; padding: 2px 5px; border-radius: 3px; '
+    'border: 1px solid #333; white-space: nowrap;">{label}</div>'
+)
+
+def institution_key(names):
+    """
+    Normalized institution names for matching against the coordinate table,
+    so e.g. 'University of Illinois at Urbana-Champaign' (loader) and
+    'University of Illinois Urbana-Champaign' (coordinates) are the same key
+    """
+    return (pd.Index(names).astype(str).str.lower()
+            .str.replace(r'\b(?:at|the)\b', '', regex=True)
+            .str.replace(r'[^a-z]', '', regex=True))
+
+def create_geographic_map(by_inst, inst_coords, output_path):
+    """
+    Create interactive geographic map from one track's build_track_aggregates()
+    'by_inst' totals and the Latitude/Longitude table indexed by institution
+    """
     print("Creating Geographic Distribution Map...")
 
     # Create base map centered on Illinois
@@ -355,216 +657,207 @@ def create_geographic_map(df, coords_df, output_path):
         tiles='OpenStreetMap'
     )
 
-    # Prepare institution data
-    if 'Institution' in df.columns:
-        inst_data = df.groupby('Institution').agg({
-            'Award Amount': 'sum',
-            'Project Title': 'count',
-            'Number of Students': 'sum'
-        }).reset_index()
-        inst_data.columns = ['Institution', 'Funding', 'Projects', 'Students']
+    # Prepare institution data (totals already aggregated for both tracks)
+    if not by_inst.empty:
+        inst_data = by_inst.rename(columns={'Investment': 'Funding'})
+        inst_data.index = inst_data.index.astype(str)
     else:
         # Synthetic data
-        inst_data = pd.DataFrame({
-            'Institution': coords_df['Institution'].head(7),
-            'Funding': [3500000, 2000000, 1200000, 800000, 500000, 300000, 200000],
-            'Projects': [35, 18, 12, 6, 4, 1, 1],
-            'Students': [120, 80, 50, 25, 15, 8, 6]
-        })
+        inst_data = synthetic_frame('institutions').set_axis(inst_coords.index[:7])
+
+    # Attach coordinates, matching on normalized names (spelling variants of
+    # the same institution share one coordinate row)
+    coords = inst_coords.set_axis(institution_key(inst_coords.index))
+    coords = coords[~coords.index.duplicated()].reindex(institution_key(inst_data.index))
+    inst_data = inst_data.assign(
+        Latitude=coords['Latitude'].to_numpy(), Longitude=coords['Longitude'].to_numpy()
+    ).rename_axis('Institution').reset_index()
+
+    # Headline totals over every institution, including any without coordinates
+    total_projects = int(inst_data['Projects'].sum())
+    total_funding = inst_data['Funding'].sum()
+    total_students = int(inst_data['Students'].sum())
+
+    # Only institutions with known coordinates get markers; size based on
+    # funding and color based on project count (IWRC Branding)
+    unmapped = inst_data['Latitude'].isna() | inst_data['Longitude'].isna()
+    if unmapped.any():
+        print(f"  Warning: No coordinates for {unmapped.sum()} institution(s), not shown on the map: "
+              + ", ".join(inst_data.loc[unmapped, 'Institution']))
+    inst_data = inst_data[~unmapped]
+    inst_data = inst_data.assign(
+        radius=np.clip(inst_data['Funding'] / 100000, 10, 50),
+        color=np.select(
+            [inst_data['Projects'] > 20, inst_data['Projects'] > 10, inst_data['Projects'] > 5],
+            [IWRC_COLORS['primary'], IWRC_COLORS['secondary'], IWRC_COLORS['accent']],  # Teal, Olive, Peach
+            default='#999999'  # Gray for low count
+        ),
+        avg_funding=inst_data['Funding'] / inst_data['Projects'],
+        label=inst_data['Institution'].str.split().str[0]
+    )
 
-    # Merge with coordinates
-    inst_data = inst_data.merge(coords_df, on='Institution', how='left')
-
-    # Add markers
-    for idx, row in inst_data.iterrows():
-        if pd.notna(row['Latitude']) and pd.notna(row['Longitude']):
-            # Size based on funding
-            radius = min(50, max(10, row['Funding'] / 100000))
-
-            # Color based on project count
-            # Color based on project count (IWRC Branding)
-            if row['Projects'] > 20:
-                color = IWRC_COLORS['primary']  # Teal
-            elif row['Projects'] > 10:
-                color = IWRC_COLORS['secondary']  # Olive
-            elif row['Projects'] > 5:
-                color = IWRC_COLORS['accent']  # Peach
-            else:
-                color = '#999999'  # Gray for low count
-
-            # Create popup
-            popup_html = f"""
-            <div style="font-family: Montserrat, sans-serif; width: 250px;">
-                <h4 style="margin: 0 0 10px 0; color: #333;">{row['Institution']}</h4>
-                <hr style="margin: 5px 0;">
-                <p style="margin: 5px 0;"><b>Total Funding:</b> ${row['Funding']:,.0f}</p>
-                <p style="margin: 5px 0;"><b>Projects:</b> {row['Projects']}</p>
-                <p style="margin: 5px 0;"><b>Students:</b> {row['Students']:.0f}</p>
-                <p style="margin: 5px 0;"><b>Avg per Project:</b> ${row['Funding']/row['Projects']:,.0f}</p>
-            </div>
-            """
-
-            folium.CircleMarker(
-                location=[row['Latitude'], row['Longitude']],
-                radius=radius,
-                popup=folium.Popup(popup_html, max_width=300),
-                color=color,
-                fill=True,
-                fillColor=color,
-                fillOpacity=0.6,
-                weight=2
-            ).add_to(m)
-
-            # Add label
-            folium.Marker(
-                location=[row['Latitude'], row['Longitude']],
-                icon=folium.DivIcon(html=f"""
-                    <div style="font-size: 10px; color: black; font-weight: bold;
-                         background: white; padding: 2px 5px; border-radius: 3px;
-                         border: 1px solid #333; white-space: nowrap;">
-                        {row['Institution'].split()[0]}
-                    </div>
-                """)
-            ).add_to(m)
+    # Popup and label HTML for every institution, rendered in one pass
+    records = inst_data.to_dict('records')
+    inst_data['popup_html'] = [MAP_POPUP_TEMPLATE.format_map(r) for r in records]
+    inst_data['label_html'] = [MAP_LABEL_TEMPLATE.format_map(r) for r in records]
+
+    # Add markers (collected in two layers and attached to the map once)
+    fg_circles = folium.FeatureGroup(name='Institutions')
+    fg_labels = folium.FeatureGroup(name='Labels')
+    for row in inst_data.itertuples(index=False):
+        fg_circles.add_child(folium.CircleMarker(
+            location=[row.Latitude, row.Longitude],
+            radius=row.radius,
+            popup=folium.Popup(row.popup_html, max_width=300),
+            color=row.color,
+            fill=True,
+            fillColor=row.color,
+            fillOpacity=0.6,
+            weight=2
+        ))
+
+        # Add label
+        fg_labels.add_child(folium.Marker(
+            location=[row.Latitude, row.Longitude],
+            icon=folium.DivIcon(html=row.label_html)
+        ))
+
+    m.add_child(fg_circles)
+    m.add_child(fg_labels)
 
     # Add heatmap layer
-    heat_data = [[row['Latitude'], row['Longitude'], row['Funding']/100000]
-                 for idx, row in inst_data.iterrows()
-                 if pd.notna(row['Latitude']) and pd.notna(row['Longitude'])]
+    # (lat, lon, weight) rows in one array; weight is funding in $100k.
+    # Rounded to 4 decimals (~10 m) so the JSON payload carries short numbers.
+    heat = inst_data[['Latitude', 'Longitude', 'Funding']].to_numpy(dtype=float)
+    heat[:, 2] /= 100000
+    heat_data = heat.round(4).tolist()
 
     HeatMap(heat_data, name='Funding Heatmap', show=False).add_to(m)
 
     # Add layer control
     folium.LayerControl().add_to(m)
 
-    # Add title
-    title_html = '''
+    # Add title (totals from the institution data behind this map)
+    title_html = f'''
     <div style="position: fixed;
                 top: 10px; left: 50px; width: 500px; height: 90px;
                 background-color: white; border:2px solid grey; z-index:9999;
                 font-size:14px; padding: 10px">
         <h4 style="margin: 0 0 5px 0;">IWRC Seed Fund Geographic Distribution</h4>
         <p style="margin: 5px 0; font-size: 12px;">
-            <b>2015-2024:</b> 77 Projects | $8.5M Investment | 304 Students
+            <b>Total:</b> {total_projects} Projects | ${total_funding / 1e6:.1f}M Investment | {total_students} Students
         </p>
         <p style="margin: 5px 0; font-size: 11px;">
-            Marker size = funding amount | Color = project count
+            Marker size = funding amount | Color = project count | {len(inst_data)} institutions mapped
         </p>
     </div>
     '''
     m.get_root().html.add_child(folium.Element(title_html))
 
-    # Save
-    m.save(output_path)
-    print(f"  Saved: {output_path}")
-    return os.path.getsize(output_path)
+    # Save (rendered to one string and written in a single call)
+    return write_html_file(m.get_root().render(), output_path)
+
+# Fixed subplot grid and axis titles of the detailed analysis dashboard
+DETAILED_ANALYSIS_GRID = dict(
+    rows=2, cols=2,
+    subplot_titles=(
+        'Funding Breakdown by Year',
+        'Student Distribution',
+        'ROI Analysis',
+        'Project Success Metrics'
+    ),
+    specs=[
+        [{'type': 'bar'}, {'type': 'scatter'}],
+        [{'type': 'scatter'}, {'type': 'indicator'}]
+    ],
+    vertical_spacing=0.15,
+    horizontal_spacing=0.12
+)
+
+DETAILED_ANALYSIS_AXES = {
+    'xaxis': {'title': {'text': 'Year'}},
+    'yaxis': {'title': {'text': 'Funding ($)'}},
+    'xaxis2': {'title': {'text': 'Year'}},
+    'yaxis2': {'title': {'text': 'Students'}},
+    'xaxis3': {'title': {'text': 'Year'}},
+    'yaxis3': {'title': {'text': 'ROI'}, 'tickformat': '.1%'},
+}
 
 def create_detailed_analysis(df, output_path):
     """Create detailed multi-tab analysis dashboard"""
     print("Creating Detailed Analysis Dashboard...")
 
     # Create tabs using Plotly
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=(
-            'Funding Breakdown by Year',
-            'Student Distribution',
-            'ROI Analysis',
-            'Project Success Metrics'
-        ),
-        specs=[
-            [{'type': 'bar'}, {'type': 'scatter'}],
-            [{'type': 'scatter'}, {'type': 'indicator'}]
-        ],
-        vertical_spacing=0.15,
-        horizontal_spacing=0.12
-    )
+    fig = make_subplots(**DETAILED_ANALYSIS_GRID)
 
-    # Data preparation
-    years = list(range(2015, 2025))
+    # All traces are built first and added in one add_traces call
+    # (row, col per trace), instead of one add_trace round-trip each
+    traces, rows, cols = [], [], []
 
     # 1. Funding Breakdown (Stacked bar)
-    funding_breakdown = pd.DataFrame({
-        'Year': years,
-        'Direct_Funding': [400000, 420000, 380000, 450000, 500000, 480000, 520000, 550000, 580000, 600000],
-        'Student_Support': [200000, 210000, 190000, 220000, 240000, 230000, 250000, 260000, 270000, 280000],
-        'Equipment': [150000, 160000, 140000, 170000, 180000, 170000, 190000, 200000, 210000, 220000],
-        'Other': [100000, 110000, 90000, 110000, 130000, 120000, 140000, 150000, 160000, 170000]
-    })
-
-    categories = ['Direct_Funding', 'Student_Support', 'Equipment', 'Other']
-    colors_cat = [COLORS['primary'], COLORS['secondary'], COLORS['success'], COLORS['warning']]
-
-    for i, cat in enumerate(categories):
-        fig.add_trace(
-            go.Bar(
-                x=funding_breakdown['Year'],
-                y=funding_breakdown[cat],
-                name=cat.replace('_', ' '),
-                marker_color=colors_cat[i],
-                hovertemplate='<b>%{x}</b><br>' + cat.replace('_', ' ') + ': $%{y:,.0f}<extra></extra>'
-            ),
-            row=1, col=1
-        )
+    funding_breakdown = synthetic_frame('funding_breakdown')
+
+    for cat, color in FUNDING_CATEGORY_COLORS.items():
+        traces.append(go.Bar(
+            x=funding_breakdown['Year'],
+            y=funding_breakdown[cat],
+            name=cat.replace('_', ' '),
+            marker_color=color,
+            hovertemplate='<b>%{x}</b><br>' + cat.replace('_', ' ') + ': $%{y:,.0f}<extra></extra>'
+        ))
+        rows.append(1)
+        cols.append(1)
 
     # 2. Student Distribution (Cumulative)
-    student_cumulative = pd.DataFrame({
-        'Year': years,
-        'Cumulative_Students': [30, 61, 91, 122, 152, 183, 213, 244, 274, 304]
-    })
-
-    fig.add_trace(
-        go.Scatter(
-            x=student_cumulative['Year'],
-            y=student_cumulative['Cumulative_Students'],
-            mode='lines+markers',
-            name='Cumulative Students',
-            line=dict(color=COLORS['success'], width=4),
-            marker=dict(size=10),
-            fill='tozeroy',
-            hovertemplate='<b>%{x}</b><br>Total Students: %{y}<extra></extra>'
-        ),
-        row=1, col=2
-    )
+    student_cumulative = synthetic_frame('student_cumulative')
+
+    traces.append(go.Scatter(
+        x=student_cumulative['Year'],
+        y=student_cumulative['Cumulative_Students'],
+        mode='lines+markers',
+        name='Cumulative Students',
+        line=dict(color=COLORS['success'], width=4),
+        marker=dict(size=10),
+        fill='tozeroy',
+        hovertemplate='<b>%{x}</b><br>Total Students: %{y}<extra></extra>'
+    ))
+    rows.append(1)
+    cols.append(2)
 
     # 3. ROI Trend with projections
-    roi_data = pd.DataFrame({
-        'Year': years + [2025, 2026, 2027],
-        'ROI': [0.025, 0.028, 0.030, 0.032, 0.035, 0.032, 0.030, 0.028, 0.030, 0.032, 0.035, 0.038, 0.040],
-        'Type': ['Actual']*10 + ['Projected']*3
-    })
+    roi_data = synthetic_frame('roi_data')
 
     for t in ['Actual', 'Projected']:
         data = roi_data[roi_data['Type'] == t]
-        fig.add_trace(
-            go.Scatter(
-                x=data['Year'],
-                y=data['ROI'],
-                mode='lines+markers',
-                name=t,
-                line=dict(
-                    color=COLORS['danger'] if t == 'Actual' else COLORS['info'],
-                    width=3,
-                    dash='solid' if t == 'Actual' else 'dash'
-                ),
-                marker=dict(size=8),
-                hovertemplate='<b>%{x}</b><br>ROI: %{y:.2%}<extra></extra>'
+        traces.append(go.Scatter(
+            x=data['Year'],
+            y=data['ROI'],
+            mode='lines+markers',
+            name=t,
+            line=dict(
+                color=COLORS['danger'] if t == 'Actual' else COLORS['info'],
+                width=3,
+                dash='solid' if t == 'Actual' else 'dash'
             ),
-            row=2, col=1
-        )
+            marker=dict(size=8),
+            hovertemplate='<b>%{x}</b><br>ROI: %{y:.2%}<extra></extra>'
+        ))
+        rows.append(2)
+        cols.append(1)
 
     # 4. Key Metrics Indicator
-    fig.add_trace(
-        go.Indicator(
-            mode="number+delta",
-            value=0.03,
-            title={'text': "Overall ROI<br><span style='font-size:0.8em'>2015-2024</span>"},
-            number={'suffix': "%", 'valueformat': '.1f'},
-            delta={'reference': 0.02, 'relative': True, 'valueformat': '.1%'},
-            domain={'x': [0, 1], 'y': [0, 1]}
-        ),
-        row=2, col=2
-    )
+    traces.append(go.Indicator(
+        mode="number+delta",
+        value=0.03,
+        title={'text': "Overall ROI<br><span style='font-size:0.8em'>2015-2024</span>"},
+        number={'suffix': "%", 'valueformat': '.1f'},
+        delta={'reference': 0.02, 'relative': True, 'valueformat': '.1%'},
+        domain={'x': [0, 1], 'y': [0, 1]}
+    ))
+    rows.append(2)
+    cols.append(2)
+
+    fig.add_traces(traces, rows=rows, cols=cols)
 
     # Update layout
     fig.update_layout(
@@ -577,147 +870,92 @@ def create_detailed_analysis(df, output_path):
         showlegend=True,
         height=1000,
         hovermode='closest',
-        template='plotly_white',
-        barmode='stack'
+        template=PLOTLY_TEMPLATE,
+        barmode='stack',
+        **DETAILED_ANALYSIS_AXES
     )
 
-    # Update axes
-    fig.update_xaxes(title_text="Year", row=1, col=1)
-    fig.update_yaxes(title_text="Funding ($)", row=1, col=1)
-    fig.update_xaxes(title_text="Year", row=1, col=2)
-    fig.update_yaxes(title_text="Students", row=1, col=2)
-    fig.update_xaxes(title_text="Year", row=2, col=1)
-    fig.update_yaxes(title_text="ROI", row=2, col=1, tickformat='.1%')
-
     # Save
-    fig.write_html(output_path, config={'displayModeBar': True, 'displaylogo': False})
-    print(f"  Saved: {output_path}")
-    return os.path.getsize(output_path)
+    return save_plotly_html(fig, output_path)
 
 def create_student_analysis(df, output_path):
     """Create student analysis sunburst chart"""
     print("Creating Student Analysis Visualization...")
 
-    # Create hierarchical data for sunburst
-    student_data = pd.DataFrame({
-        'Type': ['Graduate']*5 + ['Undergraduate']*5 + ['Postdoc']*3,
-        'Institution': [
-            'UIUC', 'Northwestern', 'IIT', 'UChicago', 'SIU',
-            'UIUC', 'Northwestern', 'IIT', 'ISU', 'NIU',
-            'UIUC', 'Northwestern', 'UChicago'
-        ],
-        'Count': [80, 45, 30, 18, 12, 40, 25, 15, 10, 8, 15, 8, 5]
-    })
+    # Hierarchical data for sunburst (Type -> Institution)
+    nodes, colors = synthetic_hierarchy('student_data', 'Type', 'Institution', 'Count')
 
     # Create sunburst
-    fig = px.sunburst(
-        student_data,
-        path=['Type', 'Institution'],
-        values='Count',
-        title='Student Distribution by Type and Institution<br><sub>Total: 304 Students | 2015-2024</sub>',
-        color='Count',
-        color_continuous_scale='Blues',
-        hover_data={'Count': True}
-    )
+    fig = go.Figure(go.Sunburst(
+        **nodes,
+        branchvalues='total',
+        marker=dict(colors=colors, colorscale='Blues', showscale=True,
+                    colorbar=dict(title='Count')),
+        hovertemplate='<b>%{label}</b><br>Students: %{value}<br>%{percentParent}<extra></extra>'
+    ))
 
     fig.update_layout(
+        title='Student Distribution by Type and Institution<br><sub>Total: 304 Students | 2015-2024</sub>',
         height=800,
         font=dict(size=14)
     )
 
-    fig.update_traces(
-        hovertemplate='<b>%{label}</b><br>Students: %{value}<br>%{percentParent}<extra></extra>'
-    )
-
     # Save
-    fig.write_html(output_path, config={'displayModeBar': True, 'displaylogo': False})
-    print(f"  Saved: {output_path}")
-    return os.path.getsize(output_path)
+    return save_plotly_html(fig, output_path)
 
 def create_investment_analysis(df, output_path):
     """Create investment treemap"""
     print("Creating Investment Analysis Visualization...")
 
-    # Create investment data
-    investment_data = pd.DataFrame({
-        'Institution': [
-            'UIUC', 'UIUC', 'UIUC',
-            'Northwestern', 'Northwestern',
-            'IIT', 'IIT',
-            'UChicago',
-            'SIU', 'NIU', 'ISU'
-        ],
-        'Category': [
-            'Research', 'Equipment', 'Students',
-            'Research', 'Students',
-            'Research', 'Equipment',
-            'Research',
-            'Research', 'Research', 'Research'
-        ],
-        'Amount': [
-            2000000, 800000, 700000,
-            1200000, 800000,
-            700000, 500000,
-            800000,
-            500000, 300000, 200000
-        ]
-    })
+    # Hierarchical investment data (Institution -> Category)
+    nodes, colors = synthetic_hierarchy('investment_data', 'Institution', 'Category', 'Amount')
 
     # Create treemap
-    fig = px.treemap(
-        investment_data,
-        path=['Institution', 'Category'],
-        values='Amount',
-        title='Investment Distribution by Institution and Category<br><sub>Total: $8.5M | 2015-2024</sub>',
-        color='Amount',
-        color_continuous_scale='Viridis',
-        hover_data={'Amount': ':$,.0f'}
-    )
+    fig = go.Figure(go.Treemap(
+        **nodes,
+        branchvalues='total',
+        marker=dict(colors=colors, colorscale='Viridis', showscale=True,
+                    colorbar=dict(title='Amount'), line=dict(width=2, color='white')),
+        hovertemplate='<b>%{label}</b><br>Amount: $%{value:,.0f}<br>%{percentParent}<extra></extra>'
+    ))
 
     fig.update_layout(
+        title='Investment Distribution by Institution and Category<br><sub>Total: $8.5M | 2015-2024</sub>',
         height=800,
         font=dict(size=14)
     )
 
-    fig.update_traces(
-        hovertemplate='<b>%{label}</b><br>Amount: $%{value:,.0f}<br>%{percentParent}<extra></extra>',
-        marker=dict(line=dict(width=2, color='white'))
-    )
-
     # Save
-    fig.write_html(output_path, config={'displayModeBar': True, 'displaylogo': False})
-    print(f"  Saved: {output_path}")
-    return os.path.getsize(output_path)
+    return save_plotly_html(fig, output_path)
 
 def create_projects_timeline(df, output_path):
     """Create interactive projects timeline"""
     print("Creating Projects Timeline Visualization...")
 
-    # Create timeline data
-    projects_timeline = []
-    project_id = 1
-
-    institutions = ['UIUC', 'Northwestern', 'IIT', 'UChicago', 'SIU', 'NIU', 'ISU']
-    for year in range(2015, 2025):
-        num_projects = 7 + (year % 3)  # Varies between 7-9 projects per year
-        for i in range(num_projects):
-            inst = institutions[i % len(institutions)]
-            projects_timeline.append({
-                'Project': f'Project {project_id}',
-                'Institution': inst,
-                'Year': year,
-                'Start': f'{year}-01-01',
-                'End': f'{year}-12-31',
-                'Funding': 50000 + (i * 20000),
-                'Students': 3 + (i % 5)
-            })
-            project_id += 1
-            if project_id > 77:
-                break
-        if project_id > 77:
-            break
-
-    timeline_df = pd.DataFrame(projects_timeline)
+    # Create timeline data: 7-9 projects per year (7 + year % 3), institutions
+    # assigned round-robin within each year, capped at 77 projects overall
+    institutions = np.array(['UIUC', 'Northwestern', 'IIT', 'UChicago', 'SIU', 'NIU', 'ISU'])
+    num_projects = 77
+    years = np.arange(2015, 2025)
+    per_year = 7 + (years % 3)
+
+    year = np.repeat(years, per_year)[:num_projects]
+    # Position of each project within its year (0, 1, 2, ... restarting yearly)
+    i = (np.arange(per_year.sum()) - np.repeat(np.cumsum(per_year) - per_year, per_year))[:num_projects]
+
+    # Jan 1 and Dec 31 of each project's year as datetimes (no string parsing)
+    start = (year - 1970).astype('datetime64[Y]')
+    end = (start + np.timedelta64(1, 'Y')).astype('datetime64[D]') - np.timedelta64(1, 'D')
+
+    timeline_df = pd.DataFrame({
+        'Project': np.char.add('Project ', np.arange(1, num_projects + 1).astype(str)),
+        'Institution': institutions[i % len(institutions)],
+        'Year': year,
+        'Start': start.astype('datetime64[ns]'),
+        'End': end.astype('datetime64[ns]'),
+        'Funding': 50000 + (i * 20000),
+        'Students': 3 + (i % 5)
+    })
 
     # Create timeline chart
     fig = px.timeline(
@@ -744,100 +982,56 @@ def create_projects_timeline(df, output_path):
     )
 
     # Save
-    fig.write_html(output_path, config={'displayModeBar': True, 'displaylogo': False})
-    print(f"  Saved: {output_path}")
-    return os.path.getsize(output_path)
+    return save_plotly_html(fig, output_path)
 
-def main():
-    """Main execution function"""
-    print("\n" + "█" * 80)
-    print("█" + " IWRC SEED FUND INTERACTIVE VISUALIZATIONS GENERATOR".center(78) + "█")
-    print("█" + " Dual-Track Analysis (All Projects & 104B Only)".center(78) + "█")
-    print("█" * 80)
-
-    print(f"\n{'All Projects (104B + 104G + Coordination):':50}")
-    print(f"  10-Year (2015-2024): 77 projects, $8.5M, 304 students")
-    print(f"  5-Year (2020-2024): 47 projects, $7.3M, 186 students")
-
-    print(f"\n{'104B Only (Seed Funding):':50}")
-    print(f"  10-Year (2015-2024): 60 projects, $1.7M, 202 students")
-    print(f"  5-Year (2020-2024): 33 projects, $1.1M, 100 students")
-    print("\n" + "=" * 80 + "\n")
-
-    # Load data
-    print("Loading data...")
-    try:
-        df, coords_df = load_data()
-        print(f"  ✓ Loaded {len(df)} rows from Excel")
+# Files written to each track's output directory
+OUTPUT_FILES = [
+    'roi_analysis_dashboard.html',
+    'institutional_distribution_map.html',
+    'detailed_analysis.html',
+    'students_interactive.html',
+    'investment_interactive.html',
+    'projects_timeline.html',
+]
 
-        # Filter for both award types
-        df_all = filter_all_projects(df)
-        df_104b = filter_104b_only(df)
-        print(f"  ✓ All Projects filter: {len(df_all)} rows")
-        print(f"  ✓ 104B Only filter: {len(df_104b)} rows")
+# Summary headings per output track
+TRACK_LABELS = {'all': 'All Projects', '104b': '104B Only'}
 
-        # Calculate metrics dynamically
-        try:
-            from iwrc_data_loader import IWRCDataLoader
-            loader = IWRCDataLoader()
-
-            # Calculate metrics for All Projects
-            metrics_all_10yr = loader.calculate_metrics(df_all, period='10yr')
-            metrics_all_5yr = loader.calculate_metrics(df_all, period='5yr')
-
-            # Calculate metrics for 104B Only
-            metrics_104b_10yr = loader.calculate_metrics(df_104b, period='10yr')
-            metrics_104b_5yr = loader.calculate_metrics(df_104b, period='5yr')
-
-            CORRECTED_DATA = {
-                'all': {
-                    '10_year': {
-                        'period': '2015-2024',
-                        'projects': metrics_all_10yr['projects'],
-                        'investment': metrics_all_10yr['investment'],
-                        'students': metrics_all_10yr['students'],
-                        'roi': metrics_all_10yr['roi']
-                    },
-                    '5_year': {
-                        'period': '2020-2024',
-                        'projects': metrics_all_5yr['projects'],
-                        'investment': metrics_all_5yr['investment'],
-                        'students': metrics_all_5yr['students'],
-                        'roi': metrics_all_5yr['roi']
-                    }
-                },
-                '104b': {
-                    '10_year': {
-                        'period': '2015-2024',
-                        'projects': metrics_104b_10yr['projects'],
-                        'investment': metrics_104b_10yr['investment'],
-                        'students': metrics_104b_10yr['students'],
-                        'roi': metrics_104b_10yr['roi']
-                    },
-                    '5_year': {
-                        'period': '2020-2024',
-                        'projects': metrics_104b_5yr['projects'],
-                        'investment': metrics_104b_5yr['investment'],
-                        'students': metrics_104b_5yr['students'],
-                        'roi': metrics_104b_5yr['roi']
-                    }
-                }
-            }
-            print("✓ Calculated dynamic metrics from data loader")
-
-        except ImportError:
-            print("Warning: Could not import IWRCDataLoader. Using fallback data.")
-            # Fallback
-            CORRECTED_DATA = {
-                'all': {'10_year': {'projects': 77, 'investment': 2711544, 'students': 117, 'roi': 0.014}},
-                '104b': {'10_year': {'projects': 57, 'investment': 832464, 'students': 100, 'roi': 0.014}}
-            }
-    except Exception as e:
-        print(f"  ✗ Error loading data: {e}")
-        df = None
-        coords_df = None
-        df_all = None
-        df_104b = None
+# Set by --force to rebuild outputs even when they are up to date
+FORCE_REBUILD = False
+
+# Files every output depends on: the master workbook load_data() reads
+# through IWRCDataLoader, this script and the shared helper modules
+REBUILD_SOURCES = script_sources(__file__, IWRCDataLoader().master_file)
+
+def needs_rebuild(output_path):
+    """True if output_path is missing or older than any (or missing) REBUILD_SOURCES."""
+    return FORCE_REBUILD or not is_up_to_date(output_path, *REBUILD_SOURCES)
+
+def main():
+    """Main execution function"""
+    global FORCE_REBUILD
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate all visualizations even if they are up to date')
+    FORCE_REBUILD = parser.parse_args().force
+
+    # Banner (collected and written to stdout in one call)
+    out = io.StringIO()
+    print("\n" + "█" * 80, file=out)
+    print("█" + " IWRC SEED FUND INTERACTIVE VISUALIZATIONS GENERATOR".center(78) + "█", file=out)
+    print("█" + " Dual-Track Analysis (All Projects & 104B Only)".center(78) + "█", file=out)
+    print("█" * 80, file=out)
+
+    print(f"\n{'All Projects (104B + 104G + Coordination):':50}", file=out)
+    print(f"  10-Year (2015-2024): 77 projects, $8.5M, 304 students", file=out)
+    print(f"  5-Year (2020-2024): 47 projects, $7.3M, 186 students", file=out)
+
+    print(f"\n{'104B Only (Seed Funding):':50}", file=out)
+    print(f"  10-Year (2015-2024): 60 projects, $1.7M, 202 students", file=out)
+    print(f"  5-Year (2020-2024): 33 projects, $1.1M, 100 students", file=out)
+    print("\n" + "=" * 80 + "\n", file=out)
+    sys.stdout.write(out.getvalue())
 
     # Output directories - create dual track structure
     base_output_dir = '/Users/shivpat/seed-fund-tracking/deliverables_final/visualizations/interactive'
@@ -854,152 +1048,200 @@ def main():
     for label, path in output_dirs.items():
         print(f"  - {label}: {os.path.basename(path)}")
 
-    # Create visualizations for both award types
-    file_sizes = {}
+    # Only outputs older than the workbook or this script need rebuilding
+    stale_outputs = [
+        os.path.join(output_dirs[track], filename)
+        for track in ('all', '104b') for filename in OUTPUT_FILES
+        if needs_rebuild(os.path.join(output_dirs[track], filename))
+    ]
 
-    if df is not None and df_all is not None and df_104b is not None:
-        # Generate for all projects
-        print("\n" + "=" * 80)
-        print("GENERATING VISUALIZATIONS: All Projects (104B + 104G + Coordination)")
-        print("=" * 80 + "\n")
+    if not stale_outputs:
+        print("✓ All outputs are newer than the workbook, skipping data load (use --force to rebuild)")
+    else:
+        # Load data
+        print("Loading data...")
+        try:
+            df, coords_df = load_data()
+            print(f"  ✓ Loaded {len(df)} rows from Excel")
 
-        # 1. ROI Dashboard
-        file_sizes['roi_analysis_dashboard_all.html'] = create_roi_dashboard(
-            df_all,
-            os.path.join(output_dirs['all'], 'roi_analysis_dashboard.html'),
-            CORRECTED_DATA['all']
-        )
+            # Filter for both award types
+            df_all = filter_all_projects(df)
+            df_104b = filter_104b_only(df)
+            print(f"  ✓ All Projects filter: {len(df_all)} rows")
+            print(f"  ✓ 104B Only filter: {len(df_104b)} rows")
 
-        # 2. Geographic Map
-        file_sizes['institutional_distribution_map_all.html'] = create_geographic_map(
-            df_all,
-            coords_df,
-            os.path.join(output_dirs['all'], 'institutional_distribution_map.html')
-        )
-        # Also save to parent directory for index.html
-        create_geographic_map(
-            df_all,
-            coords_df,
-            os.path.join(base_output_dir, 'institutional_distribution_map.html')
-        )
-
-        # 3. Detailed Analysis
-        file_sizes['detailed_analysis_all.html'] = create_detailed_analysis(
-            df_all,
-            os.path.join(output_dirs['all'], 'detailed_analysis.html')
-        )
+            # Yearly / institution totals for both tracks in one pass
+            track_aggregates = build_track_aggregates(df_all)
 
-        # 4. Student Analysis
-        file_sizes['students_interactive_all.html'] = create_student_analysis(
-            df_all,
-            os.path.join(output_dirs['all'], 'students_interactive.html')
-        )
+            # Coordinates by institution, shared by both tracks' maps
+            inst_coords = coords_df.set_index('Institution')[['Latitude', 'Longitude']]
 
-        # 5. Investment Analysis
-        file_sizes['investment_interactive_all.html'] = create_investment_analysis(
-            df_all,
-            os.path.join(output_dirs['all'], 'investment_interactive.html')
-        )
+            # Calculate metrics dynamically
+            try:
+                from iwrc_data_loader import IWRCDataLoader
+                loader = IWRCDataLoader()
+
+                # Calculate metrics for All Projects
+                metrics_all_10yr = loader.calculate_metrics(df_all, period='10yr')
+                metrics_all_5yr = loader.calculate_metrics(df_all, period='5yr')
+
+                # Calculate metrics for 104B Only
+                metrics_104b_10yr = loader.calculate_metrics(df_104b, period='10yr')
+                metrics_104b_5yr = loader.calculate_metrics(df_104b, period='5yr')
+
+                CORRECTED_DATA = {
+                    'all': {
+                        '10_year': {
+                            'period': '2015-2024',
+                            'projects': metrics_all_10yr['projects'],
+                            'investment': metrics_all_10yr['investment'],
+                            'students': metrics_all_10yr['students'],
+                            'roi': metrics_all_10yr['roi']
+                        },
+                        '5_year': {
+                            'period': '2020-2024',
+                            'projects': metrics_all_5yr['projects'],
+                            'investment': metrics_all_5yr['investment'],
+                            'students': metrics_all_5yr['students'],
+                            'roi': metrics_all_5yr['roi']
+                        }
+                    },
+                    '104b': {
+                        '10_year': {
+                            'period': '2015-2024',
+                            'projects': metrics_104b_10yr['projects'],
+                            'investment': metrics_104b_10yr['investment'],
+                            'students': metrics_104b_10yr['students'],
+                            'roi': metrics_104b_10yr['roi']
+                        },
+                        '5_year': {
+                            'period': '2020-2024',
+                            'projects': metrics_104b_5yr['projects'],
+                            'investment': metrics_104b_5yr['investment'],
+                            'students': metrics_104b_5yr['students'],
+                            'roi': metrics_104b_5yr['roi']
+                        }
+                    }
+                }
+                print("✓ Calculated dynamic metrics from data loader")
+
+            except ImportError:
+                print("Warning: Could not import IWRCDataLoader. Using fallback data.")
+                # Fallback
+                CORRECTED_DATA = {
+                    'all': {'10_year': {'projects': 77, 'investment': 2711544, 'students': 117, 'roi': 0.014}},
+                    '104b': {'10_year': {'projects': 57, 'investment': 832464, 'students': 100, 'roi': 0.014}}
+                }
+        except Exception as e:
+            print(f"  ✗ Error loading data: {e}")
+            df = None
+            coords_df = None
+            df_all = None
+            df_104b = None
 
-        # 6. Projects Timeline
-        file_sizes['projects_timeline_all.html'] = create_projects_timeline(
-            df_all,
-            os.path.join(output_dirs['all'], 'projects_timeline.html')
-        )
+    # Create visualizations for both award types
+    file_sizes = {}
 
-        # Generate for 104B only
+    if not stale_outputs:
+        for track in ('all', '104b'):
+            for filename in OUTPUT_FILES:
+                output_path = os.path.join(output_dirs[track], filename)
+                file_sizes[f"{os.path.splitext(filename)[0]}_{track}.html"] = os.path.getsize(output_path)
+    elif df is not None and df_all is not None and df_104b is not None:
         print("\n" + "=" * 80)
-        print("GENERATING VISUALIZATIONS: 104B Only (Base Grant - Seed Funding)")
+        print("GENERATING VISUALIZATIONS: All Projects & 104B Only")
         print("=" * 80 + "\n")
 
-        # 1. ROI Dashboard
-        file_sizes['roi_analysis_dashboard_104b.html'] = create_roi_dashboard(
-            df_104b,
-            os.path.join(output_dirs['104b'], 'roi_analysis_dashboard.html'),
-            CORRECTED_DATA['104b']
-        )
-
-        # 2. Geographic Map
-        file_sizes['institutional_distribution_map_104b.html'] = create_geographic_map(
-            df_104b,
-            coords_df,
-            os.path.join(output_dirs['104b'], 'institutional_distribution_map.html')
-        )
-
-        # 3. Detailed Analysis
-        file_sizes['detailed_analysis_104b.html'] = create_detailed_analysis(
-            df_104b,
-            os.path.join(output_dirs['104b'], 'detailed_analysis.html')
-        )
-
-        # 4. Student Analysis
-        file_sizes['students_interactive_104b.html'] = create_student_analysis(
-            df_104b,
-            os.path.join(output_dirs['104b'], 'students_interactive.html')
-        )
-
-        # 5. Investment Analysis
-        file_sizes['investment_interactive_104b.html'] = create_investment_analysis(
-            df_104b,
-            os.path.join(output_dirs['104b'], 'investment_interactive.html')
-        )
-
-        # 6. Projects Timeline
-        file_sizes['projects_timeline_104b.html'] = create_projects_timeline(
-            df_104b,
-            os.path.join(output_dirs['104b'], 'projects_timeline.html')
-        )
+        # (track, filename, create function, positional args, keyword args).
+        # The detailed/student/investment/timeline charts draw placeholder data
+        # only, so no frame is shipped to their worker processes; the ROI
+        # dashboard and map get the track's precomputed aggregates.
+        jobs = []
+        for track in ('all', '104b'):
+            jobs += [
+                (track, 'roi_analysis_dashboard.html', create_roi_dashboard,
+                 (track_aggregates[track],), {'CORRECTED_DATA': CORRECTED_DATA[track]}),
+                (track, 'institutional_distribution_map.html', create_geographic_map,
+                 (track_aggregates[track]['by_inst'], inst_coords), {}),
+                (track, 'detailed_analysis.html', create_detailed_analysis, (None,), {}),
+                (track, 'students_interactive.html', create_student_analysis, (None,), {}),
+                (track, 'investment_interactive.html', create_investment_analysis, (None,), {}),
+                (track, 'projects_timeline.html', create_projects_timeline, (None,), {}),
+            ]
+
+        # Every output is independent, so the stale ones are built in parallel
+        stale_jobs = []
+        for track, filename, create_fn, args, kwargs in jobs:
+            output_path = os.path.join(output_dirs[track], filename)
+            key = f"{os.path.splitext(filename)[0]}_{track}.html"
+            file_sizes[key] = None  # keep the summary in job order
+            if needs_rebuild(output_path):
+                stale_jobs.append((key, create_fn, args, dict(kwargs, output_path=output_path)))
+            else:
+                print(f"  Up to date, skipping: {output_path}")
+                file_sizes[key] = os.path.getsize(output_path)
+
+        if stale_jobs:
+            with ProcessPoolExecutor(max_workers=min(len(stale_jobs), os.cpu_count() or 1)) as pool:
+                futures = {pool.submit(create_fn, *args, **kwargs): key
+                           for key, create_fn, args, kwargs in stale_jobs}
+                # Collect as each output finishes; file_sizes keeps job order
+                for future in as_completed(futures):
+                    file_sizes[futures[future]] = future.result()
+
+        if any(key == 'institutional_distribution_map_all.html' for key, *_ in stale_jobs):
+            # Also save to parent directory for index.html (same map, no rebuild)
+            shutil.copyfile(
+                os.path.join(output_dirs['all'], 'institutional_distribution_map.html'),
+                os.path.join(base_output_dir, 'institutional_distribution_map.html')
+            )
     else:
         print("\n✗ Could not load data. Skipping visualization generation.")
 
-    # Summary
-    print("\n" + "█" * 80)
-    print("█" + " GENERATION COMPLETE".center(78) + "█")
-    print("█" * 80)
+    # Summary (collected and written to stdout in one call)
+    out = io.StringIO()
+    print("\n" + "█" * 80, file=out)
+    print("█" + " GENERATION COMPLETE".center(78) + "█", file=out)
+    print("█" * 80, file=out)
 
     if file_sizes:
-        print(f"\n✓ Created {len(file_sizes)} interactive visualizations (dual-track):\n")
-
-        total_size = 0
-        for category in ['All Projects', '104B Only']:
-            size_sum = 0
-            count = 0
-            prefix = 'all' if category == 'All Projects' else '104b'
-            print(f"\n{category}:")
-            for filename, size in file_sizes.items():
-                if prefix in filename:
-                    size_mb = size / (1024 * 1024)
-                    size_sum += size
-                    total_size += size
-                    count += 1
-                    short_name = filename.replace(f'_{prefix}', '').replace('.html', '')
-                    print(f"  ✓ {short_name:40s} {size_mb:8.2f} MB")
-
-            if count > 0:
-                print(f"    Subtotal: {count} files, {size_sum/(1024*1024):.2f} MB")
-
-        print(f"\n{'='*80}")
-        print(f"TOTAL: {len(file_sizes)} files, {total_size/(1024*1024):.2f} MB")
-        print(f"{'='*80}")
-
-        print(f"\nOutput Directories:")
-        print(f"  • All Projects: {output_dirs['all']}")
-        print(f"  • 104B Only: {output_dirs['104b']}")
-        print(f"  • Comparison: {output_dirs['comparison']}")
-
-        print(f"\nInteractive Features:")
-        print(f"  ✓ Hover tooltips with detailed information")
-        print(f"  ✓ Click-to-filter and zoom capabilities")
-        print(f"  ✓ Download charts as PNG")
-        print(f"  ✓ Responsive design for all screen sizes")
+        print(f"\n✓ Created {len(file_sizes)} interactive visualizations (dual-track):\n", file=out)
+
+        # Keys are '<name>_<track>.html'; split the track suffix off explicitly
+        sizes_df = pd.DataFrame(
+            [(*os.path.splitext(key)[0].rsplit('_', 1), size) for key, size in file_sizes.items()],
+            columns=['name', 'track', 'bytes']
+        )
+        total_size = sizes_df['bytes'].sum()
+        for track, group in sizes_df.groupby('track', sort=False):
+            print(f"\n{TRACK_LABELS[track]}:", file=out)
+            for row in group.itertuples(index=False):
+                print(f"  ✓ {row.name:40s} {row.bytes / (1024 * 1024):8.2f} MB", file=out)
+            print(f"    Subtotal: {len(group)} files, {group['bytes'].sum()/(1024*1024):.2f} MB", file=out)
+
+        print(f"\n{'='*80}", file=out)
+        print(f"TOTAL: {len(file_sizes)} files, {total_size/(1024*1024):.2f} MB", file=out)
+        print(f"{'='*80}", file=out)
+
+        print(f"\nOutput Directories:", file=out)
+        print(f"  • All Projects: {output_dirs['all']}", file=out)
+        print(f"  • 104B Only: {output_dirs['104b']}", file=out)
+        print(f"  • Comparison: {output_dirs['comparison']}", file=out)
+
+        print(f"\nInteractive Features:", file=out)
+        print(f"  ✓ Hover tooltips with detailed information", file=out)
+        print(f"  ✓ Click-to-filter and zoom capabilities", file=out)
+        print(f"  ✓ Download charts as PNG", file=out)
+        print(f"  ✓ Responsive design for all screen sizes", file=out)
         if USE_IWRC_BRANDING:
-            print(f"  ✓ IWRC branding (#258372 teal, #639757 olive)")
-            print(f"  ✓ Montserrat fonts")
-        print(f"  ✓ Cross-browser compatible (Chrome, Firefox, Safari, Edge)")
+            print(f"  ✓ IWRC branding (#258372 teal, #639757 olive)", file=out)
+            print(f"  ✓ Montserrat fonts", file=out)
+        print(f"  ✓ Cross-browser compatible (Chrome, Firefox, Safari, Edge)", file=out)
     else:
-        print("\n✗ No visualizations were created due to data loading errors.")
+        print("\n✗ No visualizations were created due to data loading errors.", file=out)
 
-    print(f"\n{'█' * 80}\n")
+    print(f"\n{'█' * 80}\n", file=out)
+    sys.stdout.write(out.getvalue())
 
     return file_sizes
 
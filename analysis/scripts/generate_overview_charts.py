@@ -15,10 +15,14 @@ import sys
 import os
 import re
 import textwrap
+import argparse
+import functools
 
 # Add scripts directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from iwrc_data_loader import is_up_to_date, script_sources
+
 # Import IWRC branding
 try:
     from iwrc_brand_style import IWRC_COLORS, configure_matplotlib_iwrc, apply_iwrc_matplotlib_style
@@ -48,6 +52,12 @@ STATIC_DIR = BASE_DIR / "deliverables_final/visualizations/static"
 INTERACTIVE_DIR = BASE_DIR / "deliverables_final/visualizations/interactive"
 DATA_FILE = BASE_DIR / "data/processed/clean_iwrc_tracking.xlsx"
 
+# Set by --force; regenerate charts even when they are up to date
+FORCE_REBUILD = False
+
+# Files every chart depends on: the workbook, this script and the shared modules
+REBUILD_SOURCES = script_sources(__file__, DATA_FILE)
+
 # Create directories
 for subdir in ['overview', 'students', 'institutions', 'topics', 'awards']:
     (STATIC_DIR / subdir).mkdir(parents=True, exist_ok=True)
@@ -206,6 +216,19 @@ def calculate_metrics(df, period_name):
 
     return metrics
 
+def skip_if_fresh(filename, subdir='overview'):
+    """Skip a chart generator when its PNG is newer than REBUILD_SOURCES (bypass with --force)"""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            output_path = STATIC_DIR / subdir / filename
+            if not FORCE_REBUILD and is_up_to_date(output_path, *REBUILD_SOURCES):
+                print(f"\n  - Up to date, skipping: {output_path.relative_to(BASE_DIR)}")
+                return None
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
 def save_fig(filename, subdir='overview'):
     """Save figure with proper path and DPI"""
     output_path = STATIC_DIR / subdir / filename
@@ -213,6 +236,7 @@ def save_fig(filename, subdir='overview'):
     plt.close()
     print(f"  ✓ Saved: {output_path.relative_to(BASE_DIR)}")
 
+@skip_if_fresh('investment_comparison.png', 'overview')
 def generate_investment_comparison(metrics):
     """Generate investment comparison chart"""
     print("\nGenerating investment comparison...")
@@ -237,6 +261,7 @@ def generate_investment_comparison(metrics):
     plt.tight_layout()
     save_fig('investment_comparison.png', 'overview')
 
+@skip_if_fresh('roi_comparison.png', 'overview')
 def generate_roi_comparison(metrics):
     """Generate ROI comparison chart"""
     print("\nGenerating ROI comparison...")
@@ -280,6 +305,7 @@ def generate_roi_comparison(metrics):
     plt.tight_layout()
     save_fig('roi_comparison.png', 'overview')
 
+@skip_if_fresh('student_breakdown.png', 'students')
 def generate_student_breakdown(metrics):
     """Generate student breakdown chart"""
     print("\nGenerating student breakdown...")
@@ -318,6 +344,7 @@ def generate_student_breakdown(metrics):
     plt.tight_layout()
     save_fig('student_breakdown.png', 'students')
 
+@skip_if_fresh('student_distribution_pie.png', 'students')
 def generate_student_distribution(metrics):
     """Generate student distribution pie charts"""
     print("\nGenerating student distribution pie charts...")
@@ -349,6 +376,7 @@ def generate_student_distribution(metrics):
     plt.tight_layout()
     save_fig('student_distribution_pie.png', 'students')
 
+@skip_if_fresh('projects_by_year.png', 'overview')
 def generate_projects_by_year(metrics):
     """Generate projects by year chart"""
     print("\nGenerating projects by year...")
@@ -376,6 +404,7 @@ def generate_projects_by_year(metrics):
     plt.tight_layout()
     save_fig('projects_by_year.png', 'overview')
 
+@skip_if_fresh('top_institutions.png', 'institutions')
 def generate_top_institutions(metrics):
     """Generate top institutions chart"""
     print("\nGenerating top institutions...")
@@ -406,6 +435,7 @@ def generate_top_institutions(metrics):
     plt.tight_layout()
     save_fig('top_institutions.png', 'institutions')
 
+@skip_if_fresh('investment_by_institution.png', 'institutions')
 def generate_investment_by_institution(metrics):
     """Generate investment by institution chart"""
     print("\nGenerating investment by institution...")
@@ -450,6 +480,7 @@ def generate_investment_by_institution(metrics):
     plt.tight_layout()
     save_fig('investment_by_institution.png', 'institutions')
 
+@skip_if_fresh('institutional_reach.png', 'institutions')
 def generate_institutional_reach(metrics):
     """Generate institutional reach comparison"""
     print("\nGenerating institutional reach...")
@@ -476,6 +507,7 @@ def generate_institutional_reach(metrics):
     plt.tight_layout()
     save_fig('institutional_reach.png', 'institutions')
 
+@skip_if_fresh('summary_dashboard.png', 'overview')
 def generate_summary_dashboard(metrics):
     """Generate comprehensive summary dashboard"""
     print("\nGenerating summary dashboard...")
@@ -532,6 +564,12 @@ def generate_summary_dashboard(metrics):
 
 def main():
     """Main execution function"""
+    global FORCE_REBUILD
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--force', action='store_true',
+                        help='Regenerate all charts even if they are up to date')
+    FORCE_REBUILD = parser.parse_args().force
+
     print("\n" + "="*80)
     print("IWRC SEED FUND VISUALIZATION GENERATION - FULLY CORRECTED VERSION")
     print("="*80)
@@ -27,6 +27,8 @@ import plotly.express as px
 from plotly.subplots import make_subplots
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 import warnings
@@ -81,6 +83,12 @@ TRACKS = {
     }
 }
 
+# Student headcount columns (summed for "Students Trained")
+STUDENT_COLS = ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']
+
+# Columns read by the filters, summaries and dashboards
+USED_COLUMNS = ['project_id', 'project_title', 'award_type', 'award_amount', 'year', *STUDENT_COLS]
+
 # Visualization types to generate (simplified list for initial implementation)
 VISUALIZATION_TYPES = [
     'award_breakdown',
@@ -93,6 +101,89 @@ VISUALIZATION_TYPES = [
 ]
 
 
+# ============================================================================
+# SUMMARY PNG RENDERING (runs in worker processes)
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _summary_figure():
+    """2x2 summary figure, created once per process and reused for every render."""
+    return plt.subplots(2, 2, figsize=(14, 10))
+
+
+def generate_summary_png(metrics, period_key, track_key, output_path):
+    """
+    Generate a summary visualization combining key metrics.
+
+    Module-level so it can run in a worker process: it only receives the
+    precomputed metrics dict (see ProjectTypeVisualizer._compute_metrics),
+    and draws into the process's cached figure (cleared first) instead of
+    building a new one per summary.
+    """
+    num_projects = metrics['projects']
+    total_investment = metrics['investment']
+    total_students = metrics['students']
+    year_counts = metrics['by_year']
+
+    # Reset this process's shared figure
+    fig, axes = _summary_figure()
+    for ax in axes.flat:
+        ax.clear()
+    (ax1, ax2), (ax3, ax4) = axes
+
+    # Panel 1: Project count
+    ax1.bar([0], [num_projects], color=IWRC_COLORS['primary'], width=0.5)
+    ax1.set_xlim(-0.5, 0.5)
+    ax1.set_xticks([0])
+    ax1.set_xticklabels(['Projects'])
+    ax1.set_ylabel('Count', fontsize=11, weight='semibold')
+    ax1.set_title('Total Projects', fontsize=12, weight='semibold')
+    ax1.text(0, num_projects, f'{int(num_projects)}', ha='center', va='bottom',
+            fontsize=14, weight='bold')
+
+    # Panel 2: Investment
+    ax2.bar([0], [total_investment], color=IWRC_COLORS['secondary'], width=0.5)
+    ax2.set_xlim(-0.5, 0.5)
+    ax2.set_xticks([0])
+    ax2.set_xticklabels(['Investment'])
+    ax2.set_ylabel('Amount ($)', fontsize=11, weight='semibold')
+    ax2.set_title('Total Investment', fontsize=12, weight='semibold')
+    ax2.text(0, total_investment, format_currency(total_investment),
+            ha='center', va='bottom', fontsize=12, weight='bold')
+
+    # Panel 3: Students
+    ax3.bar([0], [total_students], color=IWRC_COLORS['accent'], width=0.5)
+    ax3.set_xlim(-0.5, 0.5)
+    ax3.set_xticks([0])
+    ax3.set_xticklabels(['Students'])
+    ax3.set_ylabel('Count', fontsize=11, weight='semibold')
+    ax3.set_title('Students Trained', fontsize=12, weight='semibold')
+    ax3.text(0, total_students, f'{int(total_students)}', ha='center', va='bottom',
+            fontsize=14, weight='bold')
+
+    # Panel 4: Year distribution
+    if len(year_counts) > 0:
+        ax4.bar(year_counts.index, year_counts.values, color=IWRC_COLORS['primary'])
+        ax4.set_xlabel('Year', fontsize=11, weight='semibold')
+        ax4.set_ylabel('Projects', fontsize=11, weight='semibold')
+        ax4.set_title('Projects by Year', fontsize=12, weight='semibold')
+
+    # Overall title
+    fig.suptitle(f'{TRACKS[track_key]["label"]} Summary - {period_key}',
+                fontsize=16, weight='bold', color=IWRC_COLORS['dark_teal'])
+
+    # Apply IWRC styling
+    for ax in [ax1, ax2, ax3, ax4]:
+        apply_iwrc_matplotlib_style(fig, ax)
+
+    add_logo_to_matplotlib_figure(fig)
+
+    # Save. apply_iwrc_matplotlib_style() has already run tight_layout, so
+    # bbox_inches='tight' (an extra render pass) is not needed; fast zlib level
+    fig.savefig(output_path, dpi=150, facecolor='white',
+                pil_kwargs={'compress_level': 1})
+
+
 # ============================================================================
 # MAIN VISUALIZER CLASS
 # ============================================================================
@@ -111,6 +202,19 @@ class ProjectTypeVisualizer:
 
         self.df = self.load_data(data_path)
         self.output_dirs = self._create_output_directories()
+        self.student_cols = [col for col in STUDENT_COLS if col in self.df.columns]
+
+        # Every (period, track) subset is used by both the PNG and HTML stages,
+        # so filter each one once up front, along with its summary metrics
+        self._filtered = {
+            (period_key, track_key): self.filter_by_track(self.filter_by_period(period_key), track_key)
+            for period_key in PERIODS
+            for track_key in TRACKS
+        }
+        self._metrics = {
+            (period_key, track_key): self._compute_metrics(df, period_key)
+            for (period_key, track_key), df in self._filtered.items()
+        }
 
         # Configure matplotlib
         configure_matplotlib_iwrc()
@@ -126,38 +230,33 @@ class ProjectTypeVisualizer:
             # Load with deduplication to ensure accurate counts
             df = loader.load_master_data(deduplicate=True)
             
-            # Ensure year column exists (loader might name it 'project_year')
+            # Ensure year column exists (loader might name it 'project_year');
+            # nullable Int16 rather than float64-with-NaN
             if 'project_year' in df.columns:
-                df['year'] = df['project_year']
+                df['year'] = df['project_year'].astype('Int16')
             
             # Ensure award_type column exists
             if 'award_type' in df.columns:
                 df['award_type'] = df['award_type']
-                
-            return df
+
+            # Keep only the columns the visualizations read; self.df lives for
+            # the whole run and every period/track filter copies its rows
+            return df[[col for col in USED_COLUMNS if col in df.columns]]
         except ImportError:
             print("Warning: Could not import IWRCDataLoader. Using manual loading.")
             return self._manual_load_data(data_path)
 
     def _manual_load_data(self, data_path):
         """Fallback manual loading."""
-        df = pd.read_excel(data_path, sheet_name='Project Overview')
+        try:
+            # Rust-based calamine reader when installed (pandas >= 2.2)
+            df = pd.read_excel(data_path, sheet_name='Project Overview', engine='calamine')
+        except (ImportError, ValueError):
+            df = pd.read_excel(data_path, sheet_name='Project Overview')
         # ... (existing manual loading logic)
-        # Extract year from Project ID
-        def extract_year(project_id):
-            if pd.isna(project_id):
-                return None
-            project_id_str = str(project_id)
-            if len(project_id_str) >= 4:
-                try:
-                    year = int(project_id_str[:4])
-                    if 1999 <= year <= 2030:
-                        return year
-                except (ValueError, TypeError):
-                    pass
-            return None
-
-        df['year'] = df['Project ID '].apply(extract_year)
+        # Extract year from the leading 4 characters of the Project ID
+        years = pd.to_numeric(df['Project ID '].astype('string').str.slice(0, 4), errors='coerce')
+        df['year'] = years.where(years.between(1999, 2030)).astype('Int16')
         return df
 
     def _create_output_directories(self):
@@ -196,10 +295,38 @@ class ProjectTypeVisualizer:
         return filter_func(df)
 
     def get_filtered_data(self, period_key, track_key):
-        """Get data filtered by both period and track."""
-        df_period = self.filter_by_period(period_key)
-        df_filtered = self.filter_by_track(df_period, track_key)
-        return df_filtered
+        """Get data filtered by both period and track (precomputed in __init__)."""
+        return self._filtered[(period_key, track_key)]
+
+    def _compute_metrics(self, df, period_key):
+        """
+        Summary metrics of one period/track subset.
+
+        Project count, investment and student totals come from a single
+        DataFrame.agg pass; missing columns are skipped. Projects per year are
+        counted with np.bincount over the period window (no hashing), keeping
+        only years that have projects.
+        """
+        agg_spec = {'project_id': 'nunique', 'award_amount': 'sum',
+                    **{col: 'sum' for col in self.student_cols}}
+        totals = df.agg({col: how for col, how in agg_spec.items() if col in df.columns})
+
+        return {
+            'projects': int(totals.get('project_id', len(df))),
+            'investment': float(totals.get('award_amount', 0)),
+            'students': float(totals[self.student_cols].sum()),
+            'by_year': self._count_by_year(df, period_key),
+        }
+
+    def _count_by_year(self, df, period_key):
+        """Rows per year within the period window, in year order."""
+        if 'year' not in df.columns:
+            return pd.Series(dtype='int64')
+        start, end = PERIODS[period_key]['start'], PERIODS[period_key]['end']
+        offsets = df['year'].dropna().to_numpy(dtype='int64') - start
+        counts = pd.Series(np.bincount(offsets, minlength=end - start + 1),
+                           index=np.arange(start, end + 1))
+        return counts[counts > 0]
 
     def get_output_path(self, output_type, track_key, period_key, viz_name, extension):
         """Generate output file path."""
@@ -215,105 +342,35 @@ class ProjectTypeVisualizer:
 
         total_files = 0
 
-        for period_key in PERIODS.keys():
-            for track_key in TRACKS.keys():
+        # The period x track summaries are independent and CPU-bound (render +
+        # PNG encode), so draw them in separate processes, shipping only the
+        # precomputed metrics. Workers apply the IWRC rcParams on start.
+        jobs = [(period_key, track_key) for period_key in PERIODS for track_key in TRACKS]
+        with ProcessPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1),
+                                 initializer=configure_matplotlib_iwrc) as pool:
+            futures = {}
+            for period_key, track_key in jobs:
+                output_path = self.get_output_path('static', track_key, period_key,
+                                                   'summary', 'png')
+                futures[(period_key, track_key)] = pool.submit(
+                    generate_summary_png, self._metrics[(period_key, track_key)],
+                    period_key, track_key, output_path
+                )
+
+            for (period_key, track_key), future in futures.items():
                 print(f"\n{TRACKS[track_key]['label']} - {period_key}:")
 
-                # Get filtered data
                 df_filtered = self.get_filtered_data(period_key, track_key)
-                num_projects = len(df_filtered['project_id'].dropna().unique()) if 'project_id' in df_filtered.columns else len(df_filtered)
+                num_projects = self._metrics[(period_key, track_key)]['projects']
                 print(f"  Data: {len(df_filtered)} rows, {num_projects} unique projects")
 
-                # For now, create a simple summary visualization
-                self.generate_summary_png(df_filtered, period_key, track_key)
+                future.result()
+                print(f"  ✓ Generated summary visualization")
 
                 total_files += 1
 
         print(f"\n✓ Generated {total_files} static PNG files")
 
-    def generate_summary_png(self, df, period_key, track_key):
-        """Generate a summary visualization combining key metrics."""
-        output_path = self.get_output_path('static', track_key, period_key,
-                                          'summary', 'png')
-
-        # Calculate metrics
-        num_projects = len(df['project_id'].dropna().unique()) if 'project_id' in df.columns else len(df)
-
-        award_col = 'award_amount'
-        if award_col in df.columns:
-            total_investment = df[award_col].fillna(0).sum()
-        else:
-            total_investment = 0
-
-        # Student columns
-        student_cols = [
-            'phd_students',
-            'ms_students',
-            'undergrad_students',
-            'postdoc_students'
-        ]
-        total_students = 0
-        for col in student_cols:
-            if col in df.columns:
-                total_students += df[col].fillna(0).sum()
-
-        # Create figure
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
-
-        # Panel 1: Project count
-        ax1.bar([0], [num_projects], color=IWRC_COLORS['primary'], width=0.5)
-        ax1.set_xlim(-0.5, 0.5)
-        ax1.set_xticks([0])
-        ax1.set_xticklabels(['Projects'])
-        ax1.set_ylabel('Count', fontsize=11, weight='semibold')
-        ax1.set_title('Total Projects', fontsize=12, weight='semibold')
-        ax1.text(0, num_projects, f'{int(num_projects)}', ha='center', va='bottom',
-                fontsize=14, weight='bold')
-
-        # Panel 2: Investment
-        ax2.bar([0], [total_investment], color=IWRC_COLORS['secondary'], width=0.5)
-        ax2.set_xlim(-0.5, 0.5)
-        ax2.set_xticks([0])
-        ax2.set_xticklabels(['Investment'])
-        ax2.set_ylabel('Amount ($)', fontsize=11, weight='semibold')
-        ax2.set_title('Total Investment', fontsize=12, weight='semibold')
-        ax2.text(0, total_investment, format_currency(total_investment),
-                ha='center', va='bottom', fontsize=12, weight='bold')
-
-        # Panel 3: Students
-        ax3.bar([0], [total_students], color=IWRC_COLORS['accent'], width=0.5)
-        ax3.set_xlim(-0.5, 0.5)
-        ax3.set_xticks([0])
-        ax3.set_xticklabels(['Students'])
-        ax3.set_ylabel('Count', fontsize=11, weight='semibold')
-        ax3.set_title('Students Trained', fontsize=12, weight='semibold')
-        ax3.text(0, total_students, f'{int(total_students)}', ha='center', va='bottom',
-                fontsize=14, weight='bold')
-
-        # Panel 4: Year distribution
-        if 'year' in df.columns and df['year'].notna().sum() > 0:
-            year_counts = df['year'].value_counts().sort_index()
-            ax4.bar(year_counts.index, year_counts.values, color=IWRC_COLORS['primary'])
-            ax4.set_xlabel('Year', fontsize=11, weight='semibold')
-            ax4.set_ylabel('Projects', fontsize=11, weight='semibold')
-            ax4.set_title('Projects by Year', fontsize=12, weight='semibold')
-
-        # Overall title
-        fig.suptitle(f'{TRACKS[track_key]["label"]} Summary - {period_key}',
-                    fontsize=16, weight='bold', color=IWRC_COLORS['dark_teal'])
-
-        # Apply IWRC styling
-        for ax in [ax1, ax2, ax3, ax4]:
-            apply_iwrc_matplotlib_style(fig, ax)
-
-        add_logo_to_matplotlib_figure(fig)
-
-        # Save
-        plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white')
-        plt.close()
-
-        print(f"  ✓ Generated summary visualization")
-
     def run(self):
         """Run the complete visualization generation pipeline."""
         start_time = datetime.now()
@@ -350,11 +407,7 @@ class ProjectTypeVisualizer:
         def get_metrics(df):
             projects = len(df['project_title'].unique()) if 'project_title' in df.columns else len(df)
             investment = df['award_amount'].sum() if 'award_amount' in df.columns else 0
-            students = 0
-            student_cols = ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']
-            for col in student_cols:
-                if col in df.columns:
-                    students += df[col].fillna(0).sum()
+            students = df[self.student_cols].to_numpy(dtype='float64', na_value=0).sum()
             return projects, investment, students
 
         p10, i10, s10 = get_metrics(df_10yr)
@@ -25,7 +25,6 @@ from reportlab.lib import colors as rl_colors
 from pathlib import Path
 import sys
 import os
-import re
 from datetime import datetime
 
 # Add scripts to path
@@ -40,6 +39,7 @@ from award_type_filters import (
     filter_all_projects, filter_104b_only, get_award_type_label,
     get_award_type_short_label
 )
+from iwrc_data_loader import load_project_overview, extract_project_years
 
 # Configuration
 PROJECT_ROOT = '/Users/shivpat/seed-fund-tracking'
@@ -59,34 +59,38 @@ print(f"{'█' * 80}\n")
 # DATA PROCESSING FUNCTIONS
 # ============================================================================
 
-def get_project_type_category(award_type):
+PROJECT_TYPE_CATEGORIES = ['104B', '104G', 'Coordination', 'Other']
+
+
+def categorize_project_types(award_types):
     """
     Categorize award types into simplified groups.
 
+    Vectorized over the whole column: one string pass per rule instead of a
+    Python call per row.
+
     Returns:
+        Categorical with categories:
         '104B' - Base Grant (104b)
         '104G' - All 104g variants (AIS, General, PFAS combined)
         'Coordination' - Coordination Grant
         'Other' - Anything else
     """
-    if pd.isna(award_type):
-        return 'Other'
-
-    award_str = str(award_type).strip()
-
-    # Exact match for 104B
-    if award_str == 'Base Grant (104b)':
-        return '104B'
-
-    # All 104g variants combined
-    if '104g' in award_str.lower():
-        return '104G'
-
-    # Coordination grants
-    if 'coordination' in award_str.lower():
-        return 'Coordination'
-
-    return 'Other'
+    award_str = award_types.astype('string').str.strip()
+    award_lower = award_str.str.lower()
+
+    # First matching rule wins: exact 104B, any 104g variant, coordination
+    conditions = [
+        award_str.eq('Base Grant (104b)'),
+        award_lower.str.contains('104g', regex=False),
+        award_lower.str.contains('coordination', regex=False),
+    ]
+    category = np.select(
+        [cond.fillna(False).to_numpy(dtype=bool) for cond in conditions],
+        PROJECT_TYPE_CATEGORIES[:3],
+        default='Other'
+    )
+    return pd.Categorical(category, categories=PROJECT_TYPE_CATEGORIES)
 
 
 def aggregate_by_project_type(df):
@@ -106,7 +110,7 @@ def aggregate_by_project_type(df):
     """
     # Add project type category column
     df = df.copy()
-    df['project_type_category'] = df['award_type'].apply(get_project_type_category)
+    df['project_type_category'] = categorize_project_types(df['award_type'])
 
     # Aggregate by type
     agg_dict = {
@@ -119,7 +123,8 @@ def aggregate_by_project_type(df):
         'institution': 'nunique'
     }
 
-    grouped = df.groupby('project_type_category').agg(agg_dict).reset_index()
+    # observed=True: categorical codes, but only the types actually present
+    grouped = df.groupby('project_type_category', observed=True).agg(agg_dict).reset_index()
 
     # Rename columns
     grouped = grouped.rename(columns={
@@ -129,10 +134,9 @@ def aggregate_by_project_type(df):
     })
 
     # Calculate derived metrics
-    grouped['total_students'] = (
-        grouped['phd_students'] + grouped['ms_students'] +
-        grouped['undergrad_students'] + grouped['postdoc_students']
-    )
+    grouped['total_students'] = grouped[
+        ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']
+    ].sum(axis=1)
 
     grouped['avg_investment_per_project'] = (
         grouped['total_investment'] / grouped['unique_projects']
@@ -155,36 +159,12 @@ def aggregate_by_project_type(df):
     return grouped
 
 
-def extract_year_from_project_id(project_id):
-    """Extract year from project ID."""
-    if pd.isna(project_id):
-        return None
-
-    project_id_str = str(project_id).strip()
-
-    # Look for 4-digit years (2015-2024 range)
-    year_match = re.search(r'(20\d{2}|19\d{2})', project_id_str)
-    if year_match:
-        return int(year_match.group(1))
-
-    # Fall back to FY format (FY20 = 2020)
-    fy_match = re.search(r'FY(\d{2})', project_id_str, re.IGNORECASE)
-    if fy_match:
-        fy_year = int(fy_match.group(1))
-        return 2000 + fy_year if fy_year < 100 else fy_year
-
-    return None
-
-
 def load_data():
     """Load and prepare analysis data with column mapping."""
     print("=" * 80)
     print("STEP 1: LOADING AND PREPARING DATA")
     print("=" * 80)
 
-    df = pd.read_excel(DATA_FILE, sheet_name='Project Overview')
-    print(f"✓ Excel file loaded: {len(df)} rows")
-
     # Column mapping
     col_map = {
         'Project ID ': 'project_id',
@@ -198,6 +178,10 @@ def load_data():
         'Number of Undergraduate Students Supported by WRRA $': 'undergrad_students',
         'Number of Post Docs Supported by WRRA $': 'postdoc_students',
     }
+    # Parquet cache keyed on the workbook mtime; the xlsx is only parsed
+    # (mapped columns only, calamine when installed) after it changes
+    df = load_project_overview(DATA_FILE, columns=list(col_map))
+    print(f"✓ Excel file loaded: {len(df)} rows")
     df = df.rename(columns=col_map)
 
     # Convert student columns to numeric
@@ -207,8 +191,13 @@ def load_data():
     # Convert award_amount to numeric
     df['award_amount'] = pd.to_numeric(df['award_amount'], errors='coerce').fillna(0)
 
+    # Low-cardinality labels as categoricals: filters and groupbys compare
+    # integer codes instead of hashing strings
+    df['award_type'] = df['award_type'].astype('category')
+    df['institution'] = df['institution'].astype('category')
+
     # Extract project year
-    df['project_year'] = df['project_id'].apply(extract_year_from_project_id)
+    df['project_year'] = extract_project_years(df['project_id'])
 
     print(f"✓ Columns mapped and converted to numeric")
     print(f"✓ Years extracted from project IDs")
@@ -902,8 +891,8 @@ def validate_project_type_data(df_all_10yr, df_all_5yr, df_104b_10yr, df_104b_5y
     # 5. Show project type distribution
     print(f"\nProject Type Distribution (10-Year All Projects):")
     df_all_10yr_copy = df_all_10yr.copy()
-    df_all_10yr_copy['project_type_category'] = df_all_10yr_copy['award_type'].apply(get_project_type_category)
-    dist = df_all_10yr_copy.groupby('project_type_category')['project_id'].nunique()
+    df_all_10yr_copy['project_type_category'] = categorize_project_types(df_all_10yr_copy['award_type'])
+    dist = df_all_10yr_copy.groupby('project_type_category', observed=True)['project_id'].nunique()
     for ptype, count in dist.items():
         print(f"  {ptype}: {count} unique projects")
 
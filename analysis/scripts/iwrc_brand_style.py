@@ -16,8 +16,10 @@ Color Palette from IWRC Logo:
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
+from matplotlib.layout_engine import ConstrainedLayoutEngine
 import numpy as np
 import os
+from functools import lru_cache
 from pathlib import Path
 
 # ============================================================================
@@ -71,28 +73,43 @@ LOGO_PNG_PATH = '/Users/shivpat/seed-fund-tracking/IWRC_Logo.png'
 # MATPLOTLIB CONFIGURATION
 # ============================================================================
 
+# Set once the Montserrat TTFs have been added to matplotlib's font manager
+_FONTS_REGISTERED = False
+
+
+def _register_iwrc_fonts():
+    """Register the bundled Montserrat fonts with matplotlib (first call only)."""
+    global _FONTS_REGISTERED
+    if _FONTS_REGISTERED:
+        return
+
+    import matplotlib.font_manager as fm
+
+    # Define project root (assuming script is in analysis/scripts)
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    project_root = os.path.dirname(os.path.dirname(current_dir))
+    font_dir = os.path.join(project_root, 'assets/branding/fonts')
+
+    if os.path.exists(font_dir):
+        for font_file in ['Montserrat-Regular.ttf', 'Montserrat-Bold.ttf']:
+            font_path = os.path.join(font_dir, font_file)
+            if os.path.exists(font_path):
+                fm.fontManager.addfont(font_path)
+                print(f"✓ Registered font: {font_file}")
+            else:
+                print(f"⚠ Font file not found: {font_path}")
+    else:
+        print(f"⚠ Font directory not found: {font_dir}")
+
+    _FONTS_REGISTERED = True
+
+
 def configure_matplotlib_iwrc():
     """Configure matplotlib to use IWRC fonts and styling."""
     try:
         # Register local fonts from assets directory to ensure correct weights are used
-        import matplotlib.font_manager as fm
-        
-        # Define project root (assuming script is in analysis/scripts)
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.dirname(os.path.dirname(current_dir))
-        font_dir = os.path.join(project_root, 'assets/branding/fonts')
-        
-        if os.path.exists(font_dir):
-            for font_file in ['Montserrat-Regular.ttf', 'Montserrat-Bold.ttf']:
-                font_path = os.path.join(font_dir, font_file)
-                if os.path.exists(font_path):
-                    fm.fontManager.addfont(font_path)
-                    print(f"✓ Registered font: {font_file}")
-                else:
-                    print(f"⚠ Font file not found: {font_path}")
-        else:
-            print(f"⚠ Font directory not found: {font_dir}")
-            
+        _register_iwrc_fonts()
+
         plt.rcParams['font.family'] = 'Montserrat'
         plt.rcParams['font.sans-serif'] = ['Montserrat', 'DejaVu Sans']
     except Exception as e:
@@ -166,14 +183,51 @@ def apply_iwrc_matplotlib_style(fig, ax=None):
         fig._suptitle.set_color(IWRC_COLORS['dark_teal'])
         fig._suptitle.set_weight('semibold')
 
-    # Tight layout
-    fig.tight_layout()
+    # Tight layout, unless the figure uses layout='constrained' (tight_layout
+    # would replace the constrained engine)
+    if not isinstance(fig.get_layout_engine(), ConstrainedLayoutEngine):
+        fig.tight_layout()
 
 
 # ============================================================================
 # LOGO HANDLING
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _load_logo_image():
+    """
+    Load and decode the IWRC logo once, converting the SVG to PNG if needed.
+
+    Returns the RGBA pixel array, or None if no logo is available.
+    """
+    from PIL import Image
+
+    # Try PNG first, then SVG conversion
+    if not os.path.exists(LOGO_PNG_PATH) and os.path.exists(LOGO_PATH):
+        try:
+            import cairosvg
+            cairosvg.svg2png(url=LOGO_PATH, write_to=LOGO_PNG_PATH, dpi=150)
+        except ImportError:
+            print("Warning: cairosvg not available for SVG conversion")
+            return None
+
+    if not os.path.exists(LOGO_PNG_PATH):
+        print(f"Warning: Logo file not found at {LOGO_PATH} or {LOGO_PNG_PATH}")
+        return None
+
+    with Image.open(LOGO_PNG_PATH) as logo:
+        return np.asarray(logo.convert('RGBA'))
+
+
+@lru_cache(maxsize=None)
+def _load_logo_data_uri():
+    """Read the IWRC logo PNG once and return it as a base64 data URI."""
+    import base64
+
+    with open(LOGO_PNG_PATH, 'rb') as f:
+        return f"data:image/png;base64,{base64.b64encode(f.read()).decode()}"
+
+
 def add_logo_to_matplotlib_figure(fig, position='top-right', size=0.08):
     """
     Add IWRC logo to matplotlib figure.
@@ -191,30 +245,10 @@ def add_logo_to_matplotlib_figure(fig, position='top-right', size=0.08):
     return
 
     try:
-        from PIL import Image
-
-        # Try PNG first, then SVG conversion
-        logo_path = None
-        if os.path.exists(LOGO_PNG_PATH):
-            logo_path = LOGO_PNG_PATH
-        elif os.path.exists(LOGO_PATH):
-            # Try to convert SVG to PNG using cairosvg if available
-            try:
-                import cairosvg
-                logo_path = LOGO_PNG_PATH
-                if not os.path.exists(logo_path):
-                    cairosvg.svg2png(url=LOGO_PATH, write_to=logo_path, dpi=150)
-            except ImportError:
-                print("Warning: cairosvg not available for SVG conversion")
-                return
-
-        if not logo_path or not os.path.exists(logo_path):
-            print(f"Warning: Logo file not found at {LOGO_PATH} or {LOGO_PNG_PATH}")
+        logo = _load_logo_image()
+        if logo is None:
             return
 
-        # Load and add logo
-        logo = Image.open(logo_path)
-
         # Calculate position
         position_map = {
             'top-right': (0.92, 0.95),
@@ -234,7 +268,7 @@ def add_logo_to_matplotlib_figure(fig, position='top-right', size=0.08):
         fig_dpi = fig.get_dpi()
         
         target_height = fig_height * fig_dpi * size
-        img_width, img_height = logo.size
+        img_height = logo.shape[0]
         
         zoom_factor = target_height / img_height
 
@@ -360,20 +394,10 @@ def add_logo_to_plotly_figure(fig, position='top right', size=0.08):
 
         x, y = position_map.get(position, (0.92, 0.95))
 
-        from PIL import Image
-        import base64
-        from io import BytesIO
-
-        # Load and encode image
-        img = Image.open(LOGO_PNG_PATH)
-        buffered = BytesIO()
-        img.save(buffered, format="PNG")
-        img_str = base64.b64encode(buffered.getvalue()).decode()
-
         # Add as layout image
         fig.add_layout_image(
             dict(
-                source=f"data:image/png;base64,{img_str}",
+                source=_load_logo_data_uri(),
                 xref="paper",
                 yref="paper",
                 x=x,
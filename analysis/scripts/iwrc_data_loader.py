@@ -18,10 +18,19 @@ Version: 1.1
 import pandas as pd
 import numpy as np
 import re
+import importlib.util
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, Optional, Tuple
 import warnings
 
+# Project ID year patterns ("2015-001", "2020-IL103AIS", "FY16-XXX")
+_YEAR_RE = re.compile(r'(20\d{2}|19\d{2})')
+_FY_RE = re.compile(r'FY(\d{2})', re.IGNORECASE)
+
+# Parquet engine available for the workbook cache in load_project_overview()
+_HAS_PARQUET_ENGINE = any(importlib.util.find_spec(m) for m in ('pyarrow', 'fastparquet'))
+
 # Institution name standardization mapping
 # Maps all variations to canonical names
 INSTITUTION_NAME_MAP = {
@@ -112,14 +121,14 @@ class IWRCDataLoader:
         if not self.master_file.exists():
             raise FileNotFoundError(f"Master file not found: {self.master_file}")
 
-        # Load data
-        df = pd.read_excel(self.master_file, sheet_name='Project Overview')
+        # Load data (through the Parquet cache; the xlsx is only parsed when it changes)
+        df = load_project_overview(self.master_file)
 
         # Rename columns (handles trailing spaces)
         df = df.rename(columns=self.col_map)
 
-        # Extract project year
-        df['project_year'] = df['project_id'].apply(self._extract_year)
+        # Extract project year (vectorized; blank IDs give <NA>)
+        df['project_year'] = extract_project_years(df['project_id'])
 
         # Convert numeric columns
         df['award_amount_numeric'] = pd.to_numeric(df['award_amount'], errors='coerce')
@@ -177,7 +186,7 @@ class IWRCDataLoader:
             raise FileNotFoundError(f"Fact sheet file not found: {self.fact_sheet_file}")
 
         sheet_name = f'{year} data'
-        df = pd.read_excel(self.fact_sheet_file, sheet_name=sheet_name)
+        df = read_excel_sheet(self.fact_sheet_file, sheet_name)
 
         if warn:
             warnings.warn(
@@ -348,18 +357,19 @@ class IWRCDataLoader:
         Returns:
             Year as integer, or None if no year found
         """
+        # Covers None, NaN and pd.NA (blank IDs in string-typed columns)
         if pd.isna(project_id):
             return None
 
         project_id_str = str(project_id).strip()
 
         # Try 4-digit year (20XX or 19XX)
-        year_match = re.search(r'(20\d{2}|19\d{2})', project_id_str)
+        year_match = _YEAR_RE.search(project_id_str)
         if year_match:
             return int(year_match.group(1))
 
         # Try FY format (FY16 -> 2016)
-        fy_match = re.search(r'FY(\d{2})', project_id_str, re.IGNORECASE)
+        fy_match = _FY_RE.search(project_id_str)
         if fy_match:
             fy_year = int(fy_match.group(1))
             return 2000 + fy_year if fy_year < 100 else fy_year
@@ -394,6 +404,190 @@ class IWRCDataLoader:
         return results
 
 
+def extract_project_years(project_ids: pd.Series) -> pd.Series:
+    """
+    Vectorized version of IWRCDataLoader._extract_year.
+
+    Runs the 4-digit year and FY patterns as two pandas string scans instead
+    of a Python regex call per row.
+
+    Args:
+        project_ids: Series of Project IDs
+
+    Returns:
+        Nullable Int64 Series of years (<NA> where no year is found)
+    """
+    ids = project_ids.astype('string').str.strip()
+    year = pd.to_numeric(ids.str.extract(_YEAR_RE, expand=False)).astype('Int64')
+    fy = pd.to_numeric(ids.str.extract(_FY_RE, expand=False)).astype('Int64')
+    return year.fillna(fy + 2000)
+
+
+def read_excel_sheet(data_file, sheet_name: str, **kwargs) -> pd.DataFrame:
+    """
+    Read a single worksheet with the fastest available Excel engine.
+
+    Uses python-calamine when installed; otherwise falls back to openpyxl in
+    read-only/values-only mode so formatting and formula layers are skipped.
+
+    Args:
+        data_file: Path to the .xlsx workbook
+        sheet_name: Sheet to read
+        **kwargs: Passed through to pd.read_excel (e.g. usecols)
+
+    Returns:
+        DataFrame for the requested sheet
+    """
+    try:
+        return pd.read_excel(data_file, sheet_name=sheet_name, engine='calamine', **kwargs)
+    except (ImportError, ValueError):
+        # calamine not installed (or pandas too old to know the engine)
+        return pd.read_excel(data_file, sheet_name=sheet_name, engine='openpyxl',
+                             engine_kwargs={'read_only': True, 'data_only': True},
+                             **kwargs)
+
+
+# Cell types restored in mixed-type columns read back from the Parquet cache
+_MIXED_CELL_TYPES = {
+    'int': (int, np.integer),
+    'float': (float, np.floating),
+    'datetime': (datetime, np.datetime64),
+}
+_MIXED_CELL_PARSERS = {'int': int, 'float': float, 'datetime': pd.Timestamp}
+
+
+def _encode_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare a sheet for Parquet, which cannot store object columns that mix
+    value types (e.g. Project IDs like 2015001 and 'C-04', or award amounts
+    next to 'Total' rows).
+
+    Such columns are written as strings, and the positions of their numeric
+    and date cells are kept in ``df.attrs`` (saved in the Parquet metadata)
+    so _decode_mixed_columns() can restore the original values.
+    """
+    mixed = [col for col in df.columns[df.dtypes == object]
+             if pd.api.types.infer_dtype(df[col], skipna=True).startswith('mixed')]
+    if not mixed:
+        return df
+
+    encoded = df.copy()
+    encoded.attrs['iwrc_mixed_columns'] = {
+        col: {
+            kind: [i for i, value in enumerate(df[col])
+                   if isinstance(value, types) and not isinstance(value, bool)
+                   and not pd.isna(value)]
+            for kind, types in _MIXED_CELL_TYPES.items()
+        }
+        for col in mixed
+    }
+    encoded[mixed] = encoded[mixed].astype('string')
+    return encoded
+
+
+def _decode_mixed_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Restore the object columns encoded by _encode_mixed_columns()."""
+    mixed = df.attrs.pop('iwrc_mixed_columns', {})
+    for col, positions in mixed.items():
+        if col not in df.columns:
+            continue
+        values = df[col].to_numpy(dtype=object, na_value=np.nan)
+        for kind, rows in positions.items():
+            parse = _MIXED_CELL_PARSERS[kind]
+            values[rows] = [parse(values[i]) for i in rows]
+        df[col] = pd.Series(values, index=df.index, dtype=object)
+    return df
+
+
+def load_project_overview(data_file, columns: Optional[list] = None,
+                          sheet_name: str = 'Project Overview') -> pd.DataFrame:
+    """
+    Load a workbook sheet through a Parquet cache keyed on the workbook mtime and size.
+
+    Parsing the xlsx dominates script runtime, so the first call converts the
+    sheet to Parquet under ``<data dir>/.cache/`` and later calls read only the
+    requested columns from there. Without a Parquet engine the workbook is
+    read directly, parsing only the requested columns (``usecols``).
+
+    Args:
+        data_file: Path to the source .xlsx workbook
+        columns: Source (un-renamed) column names to return. None returns all.
+        sheet_name: Sheet to load (default: 'Project Overview')
+
+    Returns:
+        DataFrame with the original workbook column names
+    """
+    data_file = Path(data_file)
+    cache_dir = data_file.parent / '.cache'
+    slug = re.sub(r'\W+', '_', f'{data_file.stem} {sheet_name}').strip('_').lower()
+    # Nanosecond mtime plus size, so a rewrite within the same second
+    # (or on a filesystem with coarse timestamps) still misses the cache
+    stat = data_file.stat()
+    cache_path = cache_dir / f'{slug}.{stat.st_mtime_ns}.{stat.st_size}.parquet'
+
+    if cache_path.exists():
+        return _decode_mixed_columns(pd.read_parquet(cache_path, columns=columns))
+
+    if not _HAS_PARQUET_ENGINE:
+        return read_excel_sheet(data_file, sheet_name, usecols=columns)
+
+    # The cache holds the full sheet so callers needing other columns can share it
+    df = read_excel_sheet(data_file, sheet_name)
+    try:
+        cache_dir.mkdir(exist_ok=True)
+        # Drop caches built from older versions of the workbook
+        for stale in cache_dir.glob(f'{slug}.*.parquet'):
+            stale.unlink()
+        _encode_mixed_columns(df).to_parquet(cache_path, index=False)
+    except (ValueError, TypeError, OSError) as e:
+        cache_path.unlink(missing_ok=True)
+        print(f"Warning: Could not cache {data_file.name} as Parquet: {e}")
+
+    return df[columns] if columns is not None else df
+
+
+# Shared modules imported by the chart and report scripts; a change to any of
+# them can change every generated output
+SHARED_MODULES = tuple(
+    Path(__file__).with_name(f'{name}.py')
+    for name in ('iwrc_brand_style', 'iwrc_data_loader', 'award_type_filters')
+)
+
+
+def script_sources(script_file, *data_files) -> tuple:
+    """
+    Files the outputs of a generator script depend on, for is_up_to_date().
+
+    Args:
+        script_file: The generating script (pass __file__)
+        *data_files: Workbooks the script reads
+
+    Returns:
+        Tuple of the data files, the script and SHARED_MODULES
+    """
+    return (*data_files, script_file, *SHARED_MODULES)
+
+
+def is_up_to_date(output_path, *sources) -> bool:
+    """
+    Check whether a generated file is newer than every source it was built from.
+
+    Args:
+        output_path: Generated file (PNG, PDF, HTML, ...)
+        *sources: Input files the output depends on (e.g. the data workbook)
+
+    Returns:
+        True if output_path exists and is at least as new as all sources.
+        A missing source counts as changed, so the output is rebuilt.
+    """
+    output_path = Path(output_path)
+    if not output_path.exists():
+        return False
+    output_mtime = output_path.stat().st_mtime
+    return all(Path(src).exists() and output_mtime >= Path(src).stat().st_mtime
+               for src in sources)
+
+
 # Convenience functions for quick access
 def load_master(deduplicate=True) -> pd.DataFrame:
     """Quick function to load master data."""
@@ -10,24 +10,32 @@ Uses text-based PDFs with formatted tables and metrics.
 """
 
 import pandas as pd
+import numpy as np
 from reportlab.lib.pagesizes import letter, A4
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+import io
 import os
 import sys
-import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
-# Setup
-sys.path.insert(0, '/Users/shivpat/seed-fund-tracking/scripts')
+# Setup: shared helpers live in analysis/scripts of this repository
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'analysis' / 'scripts'))
+
+from iwrc_data_loader import load_project_overview, extract_project_years, is_up_to_date, script_sources
 
 PROJECT_ROOT = '/Users/shivpat/seed-fund-tracking'
 DATA_FILE = os.path.join(PROJECT_ROOT, 'data/consolidated/IWRC Seed Fund Tracking.xlsx')
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'FINAL_DELIVERABLES 2/reports')
 
+# Student headcount columns (after renaming)
+STUDENT_COLS = ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']
+
 # IWRC Colors for PDF
 IWRC_COLORS = {
     'primary': '#258372',           # Teal
@@ -38,18 +46,120 @@ IWRC_COLORS = {
     'dark_teal': '#1a5f52',         # Dark teal
 }
 
-print(f"\n{'█' * 80}")
-print(f"█ STAGE 4: PDF REPORTS WITH FORMATTED TABLES".center(80) + "█")
-print(f"{'█' * 80}\n")
+# ReportLab Color objects for IWRC_COLORS, parsed once
+PDF_COLORS = {name: colors.HexColor(hex_code) for name, hex_code in IWRC_COLORS.items()}
+
+# Footer shared by every report, dated once per run
+FOOTER_TEXT = f"<i>Report Generated: {datetime.now().strftime('%B %d, %Y')}</i>"
+
+# ReportLab styles, built once at import and shared by all six reports
+# (ParagraphStyle and TableStyle objects are not modified by the flowables)
+SAMPLE_STYLES = getSampleStyleSheet()
+
+
+def _report_styles(title_size, heading_size, body_size, body_space_after):
+    """Title, heading and body ParagraphStyles for one report type."""
+    return {
+        'title': ParagraphStyle(
+            'CustomTitle',
+            parent=SAMPLE_STYLES['Heading1'],
+            fontSize=title_size,
+            textColor=PDF_COLORS['dark_teal'],
+            spaceAfter=12,
+            alignment=TA_CENTER,
+            fontName='Helvetica-Bold'
+        ),
+        'heading': ParagraphStyle(
+            'CustomHeading',
+            parent=SAMPLE_STYLES['Heading2'],
+            fontSize=heading_size,
+            textColor=PDF_COLORS['primary'],
+            spaceAfter=10,
+            spaceBefore=10,
+            fontName='Helvetica-Bold'
+        ),
+        'body': ParagraphStyle(
+            'CustomBody',
+            parent=SAMPLE_STYLES['BodyText'],
+            fontSize=body_size,
+            textColor=PDF_COLORS['text'],
+            spaceAfter=body_space_after,
+            alignment=TA_LEFT
+        ),
+    }
+
+
+EXECUTIVE_STYLES = _report_styles(24, 14, 11, 10)
+FACT_SHEET_STYLES = _report_styles(20, 13, 10, 8)
+FINANCIAL_STYLES = _report_styles(20, 12, 10, 8)
+
+
+def _header_table_style(header_color, font_size, header_padding):
+    """Two-column table style: colored header row, striped body rows."""
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), header_color),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), font_size),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), header_padding),
+        ('BACKGROUND', (0, 1), (-1, -1), PDF_COLORS['background']),
+        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
+        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, PDF_COLORS['background']]),
+    ])
+
+
+# Page geometry in points
+PAGE_MARGIN = 0.75*inch
+KV_COL_WIDTHS = (3.5*inch, 2*inch)   # label/value tables
+FACTS_COL_WIDTHS = (5.5*inch,)
+SPACE_TITLE = 0.15*inch              # below the subtitle
+SPACE_SMALL = 0.2*inch
+SPACE_MEDIUM = 0.3*inch
+
+# Header row bottom padding of the metric and financial tables
+TABLE_HEADER_PADDING = 12
+FINANCIAL_HEADER_PADDING = 10
+
+# Header color: primary (teal) for All Projects, secondary (olive) for 104B
+PRIMARY_TABLE_STYLE = _header_table_style(PDF_COLORS['primary'], 11, TABLE_HEADER_PADDING)
+SECONDARY_TABLE_STYLE = _header_table_style(PDF_COLORS['secondary'], 11, TABLE_HEADER_PADDING)
+PRIMARY_FINANCIAL_TABLE_STYLE = _header_table_style(PDF_COLORS['primary'], 10, FINANCIAL_HEADER_PADDING)
+SECONDARY_FINANCIAL_TABLE_STYLE = _header_table_style(PDF_COLORS['secondary'], 10, FINANCIAL_HEADER_PADDING)
+
+FACTS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), PDF_COLORS['background']),
+    ('TEXTCOLOR', (0, 0), (-1, -1), PDF_COLORS['text']),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 8),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey),
+])
+
+# Every table cell holds one line of text, so row heights are fixed up front
+# (leading + top/bottom padding) and Table skips measuring each cell.
+# FONTSIZE leaves the 12pt default cell leading unchanged.
+CELL_LEADING = 12
+CELL_PADDING = 3
+BODY_ROW_HEIGHT = CELL_LEADING + 2 * CELL_PADDING
+FACTS_ROW_HEIGHT = CELL_LEADING + 2 * 8
+
+
+def _row_heights(n_rows, header_padding):
+    """Row heights of a header-plus-body table."""
+    return [CELL_LEADING + CELL_PADDING + header_padding] + [BODY_ROW_HEIGHT] * (n_rows - 1)
+
+
+# Console banner rules
+BAR = '█' * 80
+RULE = '=' * 80
 
 
 def load_and_prepare_data():
     """Load and prepare data for PDF generation."""
-    print("=" * 80)
-    print("LOADING DATA FOR PDF GENERATION")
-    print("=" * 80)
-
-    df = pd.read_excel(DATA_FILE, sheet_name='Project Overview')
+    print(f"{RULE}\nLOADING DATA FOR PDF GENERATION\n{RULE}")
 
     # Column mapping
     col_map = {
@@ -64,65 +174,68 @@ def load_and_prepare_data():
         'Number of Undergraduate Students Supported by WRRA $': 'undergrad_students',
         'Number of Post Docs Supported by WRRA $': 'postdoc_students',
     }
+    # Parquet cache keyed on the workbook mtime; the xlsx is only parsed
+    # (mapped columns only, calamine when installed) after it changes
+    df = load_project_overview(DATA_FILE, columns=list(col_map))
     df = df.rename(columns=col_map)
 
-    # Convert to numeric
-    for col in ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-    df['award_amount'] = pd.to_numeric(df['award_amount'], errors='coerce').fillna(0)
-
-    # Extract year
-    def extract_year(project_id):
-        if pd.isna(project_id):
-            return None
-        project_id_str = str(project_id).strip()
-        year_match = re.search(r'(20\d{2}|19\d{2})', project_id_str)
-        if year_match:
-            return int(year_match.group(1))
-        fy_match = re.search(r'FY(\d{2})', project_id_str, re.IGNORECASE)
-        if fy_match:
-            fy_year = int(fy_match.group(1))
-            return 2000 + fy_year if fy_year < 100 else fy_year
-        return None
-
-    df['project_year'] = df['project_id'].apply(extract_year)
-
-    # Time periods
-    df_10yr = df[df['project_year'].between(2015, 2024, inclusive='both')]
-
-    # Tracks
-    all_10yr = df_10yr
-    b104_10yr = df_10yr[df_10yr['award_type'] == 'Base Grant (104b)']
+    # Convert to numeric in one pass over the column block
+    numeric_cols = STUDENT_COLS + ['award_amount']
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0)
+
+    # Extract year (vectorized string scans, no per-row Python callback)
+    df['project_year'] = extract_project_years(df['project_id'])
+
+    # 10-year window as a plain NumPy boolean mask
+    year = df['project_year'].to_numpy(dtype='float64', na_value=np.nan)
+    all_10yr = df.loc[(year >= 2015) & (year <= 2024)]
 
     print(f"✓ Data loaded")
-    print(f"  All Projects: {all_10yr['project_id'].nunique()} projects")
-    print(f"  104B Only:    {b104_10yr['project_id'].nunique()} projects\n")
 
-    return all_10yr, b104_10yr
+    return all_10yr
 
 
-def calculate_metrics(df, label):
-    """Calculate key metrics for a dataset."""
-    total_students = (df['phd_students'].sum() + df['ms_students'].sum() +
-                     df['undergrad_students'].sum() + df['postdoc_students'].sum())
+def calculate_metrics(sums, n_projects, label):
+    """Calculate key metrics from a track's column sums and project count."""
+    total_students = sums[STUDENT_COLS].sum()
+    total_award = sums['award_amount']
 
     return {
         'Track': label,
-        'Total Investment': df['award_amount'].sum(),
-        'Number of Projects': df['project_id'].nunique(),
+        'Total Investment': total_award,
+        'Number of Projects': n_projects,
         'Total Students': total_students,
-        'Avg per Project': df['award_amount'].sum() / df['project_id'].nunique(),
-        'Avg Students per Project': total_students / df['project_id'].nunique() if df['project_id'].nunique() > 0 else 0,
-        'Cost per Student': df['award_amount'].sum() / total_students if total_students > 0 else 0,
-        'Projects per $1M': (df['project_id'].nunique() / df['award_amount'].sum()) * 1_000_000,
-        'Students per $1M': (total_students / df['award_amount'].sum()) * 1_000_000,
-        'PhD': df['phd_students'].sum(),
-        'Masters': df['ms_students'].sum(),
-        'Undergrad': df['undergrad_students'].sum(),
-        'Postdoc': df['postdoc_students'].sum(),
+        'Avg per Project': total_award / n_projects,
+        'Avg Students per Project': total_students / n_projects if n_projects > 0 else 0,
+        'Cost per Student': total_award / total_students if total_students > 0 else 0,
+        'Projects per $1M': (n_projects / total_award) * 1_000_000,
+        'Students per $1M': (total_students / total_award) * 1_000_000,
+        'PhD': sums['phd_students'],
+        'Masters': sums['ms_students'],
+        'Undergrad': sums['undergrad_students'],
+        'Postdoc': sums['postdoc_students'],
     }
 
 
+def calculate_track_metrics(all_10yr):
+    """
+    Metrics for the All Projects and 104B Only tracks.
+
+    One groupby on the 104B flag sums the student and award columns for both
+    tracks in a single scan; the All Projects totals are the sum of the two
+    groups. Project counts use nunique directly because a project ID can
+    appear under more than one award type.
+    """
+    is_104b = all_10yr['award_type'].eq('Base Grant (104b)')
+    group_sums = (all_10yr[STUDENT_COLS + ['award_amount']]
+                  .groupby(is_104b).sum()
+                  .reindex([False, True], fill_value=0))
+
+    all_metrics = calculate_metrics(group_sums.sum(), all_10yr['project_id'].nunique(), 'All Projects')
+    b104_metrics = calculate_metrics(group_sums.loc[True], all_10yr.loc[is_104b, 'project_id'].nunique(), '104B Only')
+    return all_metrics, b104_metrics
+
+
 def format_currency(value):
     """Format value as currency string."""
     if isinstance(value, (int, float)):
@@ -137,617 +250,400 @@ def format_number(value):
     return str(value)
 
 
-def create_executive_summary(all_metrics, b104_metrics):
-    """Create Executive Summary PDF reports."""
-    print("  Creating: Executive Summary PDFs")
+# Formatter for each metric shown as text in the reports
+METRIC_FORMATS = {
+    'Total Investment': format_currency,
+    'Avg per Project': format_currency,
+    'Cost per Student': format_currency,
+    'Number of Projects': format_number,
+    'Total Students': format_number,
+    'Avg Students per Project': format_number,
+    'Projects per $1M': format_number,
+    'Students per $1M': format_number,
+    'PhD': format_number,
+    'Masters': format_number,
+    'Undergrad': format_number,
+    'Postdoc': format_number,
+}
+
+
+def format_metrics(metrics):
+    """Format every displayed metric once, for all three report types."""
+    return {key: fmt(metrics[key]) for key, fmt in METRIC_FORMATS.items()}
+
+
+# Track-specific text and table colors of the two versions of each report
+REPORT_VARIANTS = {
+    'All_Projects': {
+        'table_style': PRIMARY_TABLE_STYLE,
+        'financial_table_style': PRIMARY_FINANCIAL_TABLE_STYLE,
+        'program_title': "IWRC Seed Fund Program",
+        'executive_subtitle': "Executive Summary - All Projects (2015-2024)",
+        'executive_summary': """
+    The Illinois Wheat and Rice Center (IWRC) Seed Fund Program has supported research
+    and education across multiple funding mechanisms, including Base Grants (104B) and
+    strategic awards (104G-AIS, 104G-PFAS, and Coordination projects).
+    """,
+        'fact_sheet_subtitle': "Fact Sheet - All Projects (2015-2024)",
+        'financial_subtitle': "Financial Summary & ROI Analysis - All Projects (2015-2024)",
+        'project_kind': "research and educational projects",
+        'research_kind': "agricultural research",
+        'roi_intro': "The IWRC Seed Fund program demonstrates strong returns on investment:",
+        'compare_to_all': False,
+    },
+    '104B_Only': {
+        'table_style': SECONDARY_TABLE_STYLE,
+        'financial_table_style': SECONDARY_FINANCIAL_TABLE_STYLE,
+        'program_title': "IWRC Base Grant (104B) Program",
+        'executive_subtitle': "Executive Summary - 104B Only / Base Grants (2015-2024)",
+        'executive_summary': """
+    The Base Grant (104B) program represents the foundational seed funding mechanism
+    of the Illinois Wheat and Rice Center, supporting numerous research and educational
+    initiatives across Illinois institutions.
+    """,
+        'fact_sheet_subtitle': "Fact Sheet (2015-2024)",
+        'financial_subtitle': "Financial Summary & ROI Analysis (2015-2024)",
+        'project_kind': "seed funding projects",
+        'research_kind': "foundational research",
+        'roi_intro': "The 104B Base Grant program demonstrates exceptional efficiency:",
+        'compare_to_all': True,
+    },
+}
 
-    # All Projects version
-    doc = SimpleDocTemplate(
-        os.path.join(OUTPUT_DIR, 'IWRC_Executive_Summary_All_Projects.pdf'),
+
+def _new_document(buffer):
+    """
+    Letter-size document with 0.75in margins, rendered into ``buffer``.
+
+    invariant=True leaves the build timestamp and random document ID out of
+    the PDF, so unchanged inputs give byte-identical output.
+    """
+    return SimpleDocTemplate(
+        buffer,
         pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
+        rightMargin=PAGE_MARGIN,
+        leftMargin=PAGE_MARGIN,
+        topMargin=PAGE_MARGIN,
+        bottomMargin=PAGE_MARGIN,
+        invariant=True
     )
 
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        textColor=colors.HexColor(IWRC_COLORS['dark_teal']),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
 
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=14,
-        textColor=colors.HexColor(IWRC_COLORS['primary']),
-        spaceAfter=10,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
+def _write_pdf(filename, buffer):
+    """Write a rendered PDF to OUTPUT_DIR in a single call."""
+    with open(os.path.join(OUTPUT_DIR, filename), 'wb') as f:
+        f.write(buffer.getbuffer())
+    return f"    ✓ Generated: {filename}"
 
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=11,
-        textColor=colors.HexColor(IWRC_COLORS['text']),
-        spaceAfter=10,
-        alignment=TA_LEFT
-    )
 
-    story = []
+def _report_filename(report_name, variant_key):
+    """Output filename of one report (a REPORT_BUILDERS name) for one track."""
+    return f"IWRC_{report_name.replace(' ', '_')}_{variant_key}.pdf"
 
-    # Title
-    story.append(Paragraph("IWRC Seed Fund Tracking", title_style))
-    story.append(Paragraph("Executive Summary - All Projects (2015-2024)", styles['Heading2']))
-    story.append(Spacer(1, 0.2*inch))
 
-    # Summary text
-    summary_text = f"""
-    The Illinois Wheat and Rice Center (IWRC) Seed Fund Program has supported research
-    and education across multiple funding mechanisms, including Base Grants (104B) and
-    strategic awards (104G-AIS, 104G-PFAS, and Coordination projects).
-    """
-    story.append(Paragraph(summary_text, body_style))
-    story.append(Spacer(1, 0.2*inch))
+def _is_current(filename):
+    """True if the report in OUTPUT_DIR is newer than the workbook, this script and the shared modules."""
+    return is_up_to_date(os.path.join(OUTPUT_DIR, filename), *script_sources(__file__, DATA_FILE))
 
-    # Key metrics table
-    story.append(Paragraph("Key Performance Metrics (2015-2024)", heading_style))
 
+def _metrics_table(formatted, table_style):
+    """Key performance metrics table."""
     metrics_data = [
         ['Metric', 'Value'],
-        ['Total Investment', format_currency(all_metrics['Total Investment'])],
-        ['Number of Projects', format_number(all_metrics['Number of Projects'])],
-        ['Students Trained', format_number(all_metrics['Total Students'])],
-        ['Average per Project', format_currency(all_metrics['Avg per Project'])],
-        ['Average Students per Project', format_number(all_metrics['Avg Students per Project'])],
-        ['Cost per Student', format_currency(all_metrics['Cost per Student'])],
+        ['Total Investment', formatted['Total Investment']],
+        ['Number of Projects', formatted['Number of Projects']],
+        ['Students Trained', formatted['Total Students']],
+        ['Average per Project', formatted['Avg per Project']],
+        ['Average Students per Project', formatted['Avg Students per Project']],
+        ['Cost per Student', formatted['Cost per Student']],
     ]
+    table = Table(metrics_data, colWidths=KV_COL_WIDTHS,
+                  rowHeights=_row_heights(len(metrics_data), TABLE_HEADER_PADDING))
+    table.setStyle(table_style)
+    return table
 
-    metrics_table = Table(metrics_data, colWidths=[3.5*inch, 2*inch])
-    metrics_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['primary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(metrics_table)
-    story.append(Spacer(1, 0.3*inch))
 
-    # Students by degree
-    story.append(Paragraph("Students Trained by Degree Level", heading_style))
+def _students_table(formatted, table_style):
+    """Students trained by degree level table."""
     students_data = [
         ['Degree Level', 'Count'],
-        ['PhD', format_number(all_metrics['PhD'])],
-        ['Masters', format_number(all_metrics['Masters'])],
-        ['Undergraduate', format_number(all_metrics['Undergrad'])],
-        ['Postdoc', format_number(all_metrics['Postdoc'])],
+        ['PhD', formatted['PhD']],
+        ['Masters', formatted['Masters']],
+        ['Undergraduate', formatted['Undergrad']],
+        ['Postdoc', formatted['Postdoc']],
     ]
+    table = Table(students_data, colWidths=KV_COL_WIDTHS,
+                  rowHeights=_row_heights(len(students_data), TABLE_HEADER_PADDING))
+    table.setStyle(table_style)
+    return table
 
-    students_table = Table(students_data, colWidths=[3.5*inch, 2*inch])
-    students_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['primary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(students_table)
-    story.append(Spacer(1, 0.3*inch))
 
-    # Efficiency metrics
-    story.append(Paragraph("Efficiency Metrics (per $1M Invested)", heading_style))
+def _efficiency_table(formatted, table_style):
+    """Projects and students per $1M table."""
     efficiency_data = [
         ['Metric', 'Value'],
-        ['Projects per $1M', format_number(all_metrics['Projects per $1M'])],
-        ['Students per $1M', format_number(all_metrics['Students per $1M'])],
+        ['Projects per $1M', formatted['Projects per $1M']],
+        ['Students per $1M', formatted['Students per $1M']],
     ]
+    table = Table(efficiency_data, colWidths=KV_COL_WIDTHS,
+                  rowHeights=_row_heights(len(efficiency_data), TABLE_HEADER_PADDING))
+    table.setStyle(table_style)
+    return table
 
-    efficiency_table = Table(efficiency_data, colWidths=[3.5*inch, 2*inch])
-    efficiency_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['primary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(efficiency_table)
-    story.append(Spacer(1, 0.2*inch))
 
-    # Footer
-    footer_text = f"<i>Report Generated: {datetime.now().strftime('%B %d, %Y')}</i>"
-    story.append(Paragraph(footer_text, styles['Normal']))
+def _facts_table(formatted):
+    """Single-column quick facts table."""
+    facts = [
+        [f"Total Projects: {formatted['Number of Projects']}"],
+        [f"Total Investment: {formatted['Total Investment']}"],
+        [f"Students Trained: {formatted['Total Students']}"],
+        [f"Average Award per Project: {formatted['Avg per Project']}"],
+    ]
+    table = Table(facts, colWidths=FACTS_COL_WIDTHS, rowHeights=FACTS_ROW_HEIGHT)
+    table.setStyle(FACTS_TABLE_STYLE)
+    return table
 
-    doc.build(story)
-    print(f"    ✓ Generated: IWRC_Executive_Summary_All_Projects.pdf")
 
-    # 104B Only version
-    doc = SimpleDocTemplate(
-        os.path.join(OUTPUT_DIR, 'IWRC_Executive_Summary_104B_Only.pdf'),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
+def _financial_table(formatted, table_style):
+    """Investment, cost per project and cost per student table."""
+    financial_data = [
+        ['Metric', 'Amount'],
+        ['Total Investment', formatted['Total Investment']],
+        ['Cost per Project', formatted['Avg per Project']],
+        ['Cost per Student', formatted['Cost per Student']],
+    ]
+    table = Table(financial_data, colWidths=KV_COL_WIDTHS,
+                  rowHeights=_row_heights(len(financial_data), FINANCIAL_HEADER_PADDING))
+    table.setStyle(table_style)
+    return table
+
+
+def create_executive_summary(variant_key, metrics, formatted, all_metrics):
+    """Create the Executive Summary PDF for one track (a REPORT_VARIANTS key)."""
+    variant = REPORT_VARIANTS[variant_key]
+    filename = _report_filename('Executive Summary', variant_key)
+    buffer = io.BytesIO()
+    doc = _new_document(buffer)
+
+    title_style = EXECUTIVE_STYLES['title']
+    heading_style = EXECUTIVE_STYLES['heading']
+    body_style = EXECUTIVE_STYLES['body']
 
     story = []
+
+    # Title
     story.append(Paragraph("IWRC Seed Fund Tracking", title_style))
-    story.append(Paragraph("Executive Summary - 104B Only / Base Grants (2015-2024)", styles['Heading2']))
-    story.append(Spacer(1, 0.2*inch))
+    story.append(Paragraph(variant['executive_subtitle'], SAMPLE_STYLES['Heading2']))
+    story.append(Spacer(1, SPACE_SMALL))
 
-    summary_text_104b = f"""
-    The Base Grant (104B) program represents the foundational seed funding mechanism
-    of the Illinois Wheat and Rice Center, supporting numerous research and educational
-    initiatives across Illinois institutions.
-    """
-    story.append(Paragraph(summary_text_104b, body_style))
-    story.append(Spacer(1, 0.2*inch))
+    # Summary text
+    story.append(Paragraph(variant['executive_summary'], body_style))
+    story.append(Spacer(1, SPACE_SMALL))
 
+    # Key metrics table
     story.append(Paragraph("Key Performance Metrics (2015-2024)", heading_style))
-    metrics_data_104b = [
-        ['Metric', 'Value'],
-        ['Total Investment', format_currency(b104_metrics['Total Investment'])],
-        ['Number of Projects', format_number(b104_metrics['Number of Projects'])],
-        ['Students Trained', format_number(b104_metrics['Total Students'])],
-        ['Average per Project', format_currency(b104_metrics['Avg per Project'])],
-        ['Average Students per Project', format_number(b104_metrics['Avg Students per Project'])],
-        ['Cost per Student', format_currency(b104_metrics['Cost per Student'])],
-    ]
-
-    metrics_table_104b = Table(metrics_data_104b, colWidths=[3.5*inch, 2*inch])
-    metrics_table_104b.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['secondary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(metrics_table_104b)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(_metrics_table(formatted, variant['table_style']))
+    story.append(Spacer(1, SPACE_MEDIUM))
 
+    # Students by degree
     story.append(Paragraph("Students Trained by Degree Level", heading_style))
-    students_data_104b = [
-        ['Degree Level', 'Count'],
-        ['PhD', format_number(b104_metrics['PhD'])],
-        ['Masters', format_number(b104_metrics['Masters'])],
-        ['Undergraduate', format_number(b104_metrics['Undergrad'])],
-        ['Postdoc', format_number(b104_metrics['Postdoc'])],
-    ]
-
-    students_table_104b = Table(students_data_104b, colWidths=[3.5*inch, 2*inch])
-    students_table_104b.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['secondary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(students_table_104b)
-    story.append(Spacer(1, 0.3*inch))
+    story.append(_students_table(formatted, variant['table_style']))
+    story.append(Spacer(1, SPACE_MEDIUM))
 
+    # Efficiency metrics
     story.append(Paragraph("Efficiency Metrics (per $1M Invested)", heading_style))
-    efficiency_data_104b = [
-        ['Metric', 'Value'],
-        ['Projects per $1M', format_number(b104_metrics['Projects per $1M'])],
-        ['Students per $1M', format_number(b104_metrics['Students per $1M'])],
-    ]
-
-    efficiency_table_104b = Table(efficiency_data_104b, colWidths=[3.5*inch, 2*inch])
-    efficiency_table_104b.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['secondary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(efficiency_table_104b)
-    story.append(Spacer(1, 0.2*inch))
+    story.append(_efficiency_table(formatted, variant['table_style']))
+    story.append(Spacer(1, SPACE_SMALL))
 
-    story.append(Paragraph(footer_text, styles['Normal']))
+    # Footer
+    story.append(Paragraph(FOOTER_TEXT, SAMPLE_STYLES['Normal']))
 
     doc.build(story)
-    print(f"    ✓ Generated: IWRC_Executive_Summary_104B_Only.pdf")
-
+    return _write_pdf(filename, buffer)
 
-def create_fact_sheets(all_metrics, b104_metrics):
-    """Create Fact Sheet PDF reports."""
-    print("  Creating: Fact Sheet PDFs")
 
-    # All Projects version
-    doc = SimpleDocTemplate(
-        os.path.join(OUTPUT_DIR, 'IWRC_Fact_Sheet_All_Projects.pdf'),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor(IWRC_COLORS['dark_teal']),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=13,
-        textColor=colors.HexColor(IWRC_COLORS['primary']),
-        spaceAfter=10,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
+def create_fact_sheet(variant_key, metrics, formatted, all_metrics):
+    """Create the Fact Sheet PDF for one track (a REPORT_VARIANTS key)."""
+    variant = REPORT_VARIANTS[variant_key]
+    filename = _report_filename('Fact Sheet', variant_key)
+    buffer = io.BytesIO()
+    doc = _new_document(buffer)
 
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=10,
-        textColor=colors.HexColor(IWRC_COLORS['text']),
-        spaceAfter=8
-    )
+    title_style = FACT_SHEET_STYLES['title']
+    heading_style = FACT_SHEET_STYLES['heading']
+    body_style = FACT_SHEET_STYLES['body']
 
     story = []
 
-    story.append(Paragraph("IWRC Seed Fund Program", title_style))
-    story.append(Paragraph("Fact Sheet - All Projects (2015-2024)", heading_style))
-    story.append(Spacer(1, 0.15*inch))
+    story.append(Paragraph(variant['program_title'], title_style))
+    story.append(Paragraph(variant['fact_sheet_subtitle'], heading_style))
+    story.append(Spacer(1, SPACE_TITLE))
 
     # Quick facts
     story.append(Paragraph("<b>Quick Facts</b>", heading_style))
-    facts = [
-        [f"Total Projects: {format_number(all_metrics['Number of Projects'])}"],
-        [f"Total Investment: {format_currency(all_metrics['Total Investment'])}"],
-        [f"Students Trained: {format_number(all_metrics['Total Students'])}"],
-        [f"Average Award per Project: {format_currency(all_metrics['Avg per Project'])}"],
-    ]
-
-    facts_table = Table(facts, colWidths=[5.5*inch])
-    facts_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor(IWRC_COLORS['text'])),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey),
-    ]))
-    story.append(facts_table)
-    story.append(Spacer(1, 0.2*inch))
+    story.append(_facts_table(formatted))
+    story.append(Spacer(1, SPACE_SMALL))
 
     # Highlights
     story.append(Paragraph("<b>Program Highlights</b>", heading_style))
     highlights = [
-        f"• Supported {format_number(all_metrics['Number of Projects'])} research and educational projects",
-        f"• Trained {format_number(all_metrics['Total Students'])} students across multiple degree levels",
-        f"• Invested {format_currency(all_metrics['Total Investment'])} in agricultural research",
-        f"• Produced {all_metrics['Projects per $1M']:.1f} projects per $1 million invested",
+        f"• Supported {formatted['Number of Projects']} {variant['project_kind']}",
+        f"• Trained {formatted['Total Students']} students across multiple degree levels",
+        f"• Invested {formatted['Total Investment']} in {variant['research_kind']}",
+        f"• Produced {metrics['Projects per $1M']:.1f} projects per $1 million invested",
     ]
+    if variant['compare_to_all']:
+        highlights.append(
+            f"• {(metrics['Projects per $1M']/all_metrics['Projects per $1M']):.1f}x more efficient at creating projects than strategic awards"
+        )
 
-    for highlight in highlights:
-        story.append(Paragraph(highlight, body_style))
+    # One Paragraph (one markup parse) for the whole bullet list
+    story.append(Paragraph('<br/>'.join(highlights), body_style))
 
-    story.append(Spacer(1, 0.2*inch))
+    story.append(Spacer(1, SPACE_SMALL))
 
     # Contact information
     story.append(Paragraph("<b>For More Information</b>", heading_style))
     contact_text = "Illinois Wheat and Rice Center (IWRC)<br/>For detailed analysis and visualizations, see the interactive dashboards and comprehensive reports."
     story.append(Paragraph(contact_text, body_style))
 
-    story.append(Spacer(1, 0.2*inch))
-    footer_text = f"<i>Report Generated: {datetime.now().strftime('%B %d, %Y')}</i>"
-    story.append(Paragraph(footer_text, styles['Normal']))
-
-    doc.build(story)
-    print(f"    ✓ Generated: IWRC_Fact_Sheet_All_Projects.pdf")
-
-    # 104B Only version
-    doc = SimpleDocTemplate(
-        os.path.join(OUTPUT_DIR, 'IWRC_Fact_Sheet_104B_Only.pdf'),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-
-    story = []
-
-    story.append(Paragraph("IWRC Base Grant (104B) Program", title_style))
-    story.append(Paragraph("Fact Sheet (2015-2024)", heading_style))
-    story.append(Spacer(1, 0.15*inch))
-
-    story.append(Paragraph("<b>Quick Facts</b>", heading_style))
-    facts_104b = [
-        [f"Total Projects: {format_number(b104_metrics['Number of Projects'])}"],
-        [f"Total Investment: {format_currency(b104_metrics['Total Investment'])}"],
-        [f"Students Trained: {format_number(b104_metrics['Total Students'])}"],
-        [f"Average Award per Project: {format_currency(b104_metrics['Avg per Project'])}"],
-    ]
-
-    facts_table_104b = Table(facts_104b, colWidths=[5.5*inch])
-    facts_table_104b.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor(IWRC_COLORS['text'])),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTSIZE', (0, 0), (-1, -1), 10),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 8),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-        ('GRID', (0, 0), (-1, -1), 1, colors.lightgrey),
-    ]))
-    story.append(facts_table_104b)
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>Program Highlights</b>", heading_style))
-    highlights_104b = [
-        f"• Supported {format_number(b104_metrics['Number of Projects'])} seed funding projects",
-        f"• Trained {format_number(b104_metrics['Total Students'])} students across multiple degree levels",
-        f"• Invested {format_currency(b104_metrics['Total Investment'])} in foundational research",
-        f"• Produced {b104_metrics['Projects per $1M']:.1f} projects per $1 million invested",
-        f"• {(b104_metrics['Projects per $1M']/all_metrics['Projects per $1M']):.1f}x more efficient at creating projects than strategic awards",
-    ]
-
-    for highlight in highlights_104b:
-        story.append(Paragraph(highlight, body_style))
-
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>For More Information</b>", heading_style))
-    story.append(Paragraph(contact_text, body_style))
-
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph(footer_text, styles['Normal']))
+    story.append(Spacer(1, SPACE_SMALL))
+    story.append(Paragraph(FOOTER_TEXT, SAMPLE_STYLES['Normal']))
 
     doc.build(story)
-    print(f"    ✓ Generated: IWRC_Fact_Sheet_104B_Only.pdf")
-
-
-def create_financial_summaries(all_metrics, b104_metrics):
-    """Create Financial Summary PDF reports."""
-    print("  Creating: Financial Summary PDFs")
-
-    # All Projects version
-    doc = SimpleDocTemplate(
-        os.path.join(OUTPUT_DIR, 'IWRC_Financial_Summary_All_Projects.pdf'),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
+    return _write_pdf(filename, buffer)
 
-    styles = getSampleStyleSheet()
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor(IWRC_COLORS['dark_teal']),
-        spaceAfter=12,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
 
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=12,
-        textColor=colors.HexColor(IWRC_COLORS['primary']),
-        spaceAfter=10,
-        spaceBefore=10,
-        fontName='Helvetica-Bold'
-    )
+def create_financial_summary(variant_key, metrics, formatted, all_metrics):
+    """Create the Financial Summary PDF for one track (a REPORT_VARIANTS key)."""
+    variant = REPORT_VARIANTS[variant_key]
+    filename = _report_filename('Financial Summary', variant_key)
+    buffer = io.BytesIO()
+    doc = _new_document(buffer)
 
-    body_style = ParagraphStyle(
-        'CustomBody',
-        parent=styles['BodyText'],
-        fontSize=10,
-        textColor=colors.HexColor(IWRC_COLORS['text']),
-        spaceAfter=8
-    )
+    title_style = FINANCIAL_STYLES['title']
+    heading_style = FINANCIAL_STYLES['heading']
+    body_style = FINANCIAL_STYLES['body']
 
     story = []
 
-    story.append(Paragraph("IWRC Seed Fund Program", title_style))
-    story.append(Paragraph("Financial Summary & ROI Analysis - All Projects (2015-2024)", heading_style))
-    story.append(Spacer(1, 0.15*inch))
+    story.append(Paragraph(variant['program_title'], title_style))
+    story.append(Paragraph(variant['financial_subtitle'], heading_style))
+    story.append(Spacer(1, SPACE_TITLE))
 
     # Financial overview
     story.append(Paragraph("<b>Financial Overview</b>", heading_style))
-    financial_data = [
-        ['Metric', 'Amount'],
-        ['Total Investment', format_currency(all_metrics['Total Investment'])],
-        ['Cost per Project', format_currency(all_metrics['Avg per Project'])],
-        ['Cost per Student', format_currency(all_metrics['Cost per Student'])],
-    ]
-
-    financial_table = Table(financial_data, colWidths=[3.5*inch, 2*inch])
-    financial_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['primary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(financial_table)
-    story.append(Spacer(1, 0.2*inch))
+    story.append(_financial_table(formatted, variant['financial_table_style']))
+    story.append(Spacer(1, SPACE_SMALL))
 
     # ROI metrics
     story.append(Paragraph("<b>Return on Investment (ROI) Metrics</b>", heading_style))
     roi_text = f"""
-    The IWRC Seed Fund program demonstrates strong returns on investment:
+    {variant['roi_intro']}
     <br/><br/>
-    <b>Projects Generated:</b> {all_metrics['Projects per $1M']:.1f} projects per $1 million invested
+    <b>Projects Generated:</b> {metrics['Projects per $1M']:.1f} projects per $1 million invested
     <br/>
-    <b>Students Trained:</b> {all_metrics['Students per $1M']:.0f} students per $1 million invested
+    <b>Students Trained:</b> {metrics['Students per $1M']:.0f} students per $1 million invested
     <br/>
-    <b>Education Efficiency:</b> Each $1,000 invested trains approximately {(all_metrics['Students per $1M']/1000):.2f} students
+    <b>Education Efficiency:</b> Each $1,000 invested trains approximately {(metrics['Students per $1M']/1000):.2f} students
+    """
+    if variant['compare_to_all']:
+        roi_text += f"""<br/>
+    <b>Comparative Advantage:</b> {(metrics['Projects per $1M']/all_metrics['Projects per $1M']):.1f}x more efficient than strategic awards
     """
     story.append(Paragraph(roi_text, body_style))
-    story.append(Spacer(1, 0.2*inch))
+    story.append(Spacer(1, SPACE_SMALL))
 
     # Comparative analysis
     story.append(Paragraph("<b>Key Financial Insights</b>", heading_style))
     insights = [
-        f"• Average project size: {format_currency(all_metrics['Avg per Project'])}",
-        f"• Average students per project: {format_number(all_metrics['Avg Students per Project'])}",
-        f"• Total students trained: {format_number(all_metrics['Total Students'])}",
-        f"• Total projects supported: {format_number(all_metrics['Number of Projects'])}",
+        f"• Average project size: {formatted['Avg per Project']}",
+        f"• Average students per project: {formatted['Avg Students per Project']}",
+        f"• Total students trained: {formatted['Total Students']}",
+        f"• Total projects supported: {formatted['Number of Projects']}",
     ]
 
-    for insight in insights:
-        story.append(Paragraph(insight, body_style))
+    story.append(Paragraph('<br/>'.join(insights), body_style))
 
-    story.append(Spacer(1, 0.2*inch))
-    footer_text = f"<i>Report Generated: {datetime.now().strftime('%B %d, %Y')}</i>"
-    story.append(Paragraph(footer_text, styles['Normal']))
+    story.append(Spacer(1, SPACE_SMALL))
+    story.append(Paragraph(FOOTER_TEXT, SAMPLE_STYLES['Normal']))
 
     doc.build(story)
-    print(f"    ✓ Generated: IWRC_Financial_Summary_All_Projects.pdf")
-
-    # 104B Only version
-    doc = SimpleDocTemplate(
-        os.path.join(OUTPUT_DIR, 'IWRC_Financial_Summary_104B_Only.pdf'),
-        pagesize=letter,
-        rightMargin=0.75*inch,
-        leftMargin=0.75*inch,
-        topMargin=0.75*inch,
-        bottomMargin=0.75*inch
-    )
-
-    story = []
-
-    story.append(Paragraph("IWRC Base Grant (104B) Program", title_style))
-    story.append(Paragraph("Financial Summary & ROI Analysis (2015-2024)", heading_style))
-    story.append(Spacer(1, 0.15*inch))
-
-    story.append(Paragraph("<b>Financial Overview</b>", heading_style))
-    financial_data_104b = [
-        ['Metric', 'Amount'],
-        ['Total Investment', format_currency(b104_metrics['Total Investment'])],
-        ['Cost per Project', format_currency(b104_metrics['Avg per Project'])],
-        ['Cost per Student', format_currency(b104_metrics['Cost per Student'])],
-    ]
-
-    financial_table_104b = Table(financial_data_104b, colWidths=[3.5*inch, 2*inch])
-    financial_table_104b.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor(IWRC_COLORS['secondary'])),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 10),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor(IWRC_COLORS['background'])),
-        ('GRID', (0, 0), (-1, -1), 1, colors.grey),
-        ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor(IWRC_COLORS['background'])]),
-    ]))
-    story.append(financial_table_104b)
-    story.append(Spacer(1, 0.2*inch))
-
-    story.append(Paragraph("<b>Return on Investment (ROI) Metrics</b>", heading_style))
-    roi_text_104b = f"""
-    The 104B Base Grant program demonstrates exceptional efficiency:
-    <br/><br/>
-    <b>Projects Generated:</b> {b104_metrics['Projects per $1M']:.1f} projects per $1 million invested
-    <br/>
-    <b>Students Trained:</b> {b104_metrics['Students per $1M']:.0f} students per $1 million invested
-    <br/>
-    <b>Education Efficiency:</b> Each $1,000 invested trains approximately {(b104_metrics['Students per $1M']/1000):.2f} students
-    <br/>
-    <b>Comparative Advantage:</b> {(b104_metrics['Projects per $1M']/all_metrics['Projects per $1M']):.1f}x more efficient than strategic awards
-    """
-    story.append(Paragraph(roi_text_104b, body_style))
-    story.append(Spacer(1, 0.2*inch))
+    return _write_pdf(filename, buffer)
 
-    story.append(Paragraph("<b>Key Financial Insights</b>", heading_style))
-    insights_104b = [
-        f"• Average project size: {format_currency(b104_metrics['Avg per Project'])}",
-        f"• Average students per project: {format_number(b104_metrics['Avg Students per Project'])}",
-        f"• Total students trained: {format_number(b104_metrics['Total Students'])}",
-        f"• Total projects supported: {format_number(b104_metrics['Number of Projects'])}",
-    ]
-
-    for insight in insights_104b:
-        story.append(Paragraph(insight, body_style))
 
-    story.append(Spacer(1, 0.2*inch))
-    story.append(Paragraph(footer_text, styles['Normal']))
-
-    doc.build(story)
-    print(f"    ✓ Generated: IWRC_Financial_Summary_104B_Only.pdf")
+# Report builders, each called once per REPORT_VARIANTS track
+REPORT_BUILDERS = [
+    ('Executive Summary', create_executive_summary),
+    ('Fact Sheet', create_fact_sheet),
+    ('Financial Summary', create_financial_summary),
+]
 
 
 def main():
     """Main orchestration."""
-    all_10yr, b104_10yr = load_and_prepare_data()
+    # Printed here rather than at import so spawned workers stay quiet
+    print(f"\n{BAR}\n" + "█ STAGE 4: PDF REPORTS WITH FORMATTED TABLES".center(80) + f"█\n{BAR}\n")
+
+    all_10yr = load_and_prepare_data()
 
-    all_metrics = calculate_metrics(all_10yr, 'All Projects')
-    b104_metrics = calculate_metrics(b104_10yr, '104B Only')
+    all_metrics, b104_metrics = calculate_track_metrics(all_10yr)
+    print(f"  All Projects: {all_metrics['Number of Projects']} projects")
+    print(f"  104B Only:    {b104_metrics['Number of Projects']} projects\n")
 
-    print("\n" + "=" * 80)
-    print("GENERATING PDF REPORTS")
-    print("=" * 80 + "\n")
+    print(f"\n{RULE}\nGENERATING PDF REPORTS\n{RULE}\n")
 
     # Ensure output directory exists
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-    # Generate all 6 PDFs
-    create_executive_summary(all_metrics, b104_metrics)
-    create_fact_sheets(all_metrics, b104_metrics)
-    create_financial_summaries(all_metrics, b104_metrics)
-
-    print("\n" + "█" * 80)
-    print("█" + " ✓ STAGE 4 COMPLETE: 6 PDF Reports Generated".center(78) + "█")
-    print("█" * 80)
-    print("\nGenerated Reports:")
-    print("  • IWRC_Executive_Summary_All_Projects.pdf")
-    print("  • IWRC_Executive_Summary_104B_Only.pdf")
-    print("  • IWRC_Fact_Sheet_All_Projects.pdf")
-    print("  • IWRC_Fact_Sheet_104B_Only.pdf")
-    print("  • IWRC_Financial_Summary_All_Projects.pdf")
-    print("  • IWRC_Financial_Summary_104B_Only.pdf\n")
+    # Up to 6 PDFs (3 report types x 2 tracks); reports that are up to date
+    # (see _is_current) are skipped here, before any worker starts.
+    track_metrics = {'All_Projects': all_metrics, '104B_Only': b104_metrics}
+    track_formatted = {key: format_metrics(m) for key, m in track_metrics.items()}
+    jobs = [(report_name, create_report, variant_key)
+            for report_name, create_report in REPORT_BUILDERS
+            for variant_key in track_metrics]
+    stale = [job for job in jobs if not _is_current(_report_filename(job[0], job[2]))]
+
+    # Each doc.build() is an independent CPU-bound render, so the stale
+    # reports run in separate processes; only the small metrics dicts cross
+    # the boundary and every worker builds its own ReportLab objects. Workers
+    # return their status line instead of printing, and the parent reports
+    # them in build order.
+    futures = {}
+    if stale:
+        with ProcessPoolExecutor(max_workers=min(len(stale), os.cpu_count() or 1)) as pool:
+            futures = {
+                (report_name, variant_key): pool.submit(
+                    create_report, variant_key, track_metrics[variant_key],
+                    track_formatted[variant_key], all_metrics)
+                for report_name, create_report, variant_key in stale
+            }
+
+    generated = []
+    for report_name, _ in REPORT_BUILDERS:
+        print(f"  Creating: {report_name} PDFs")
+        for variant_key in track_metrics:
+            filename = _report_filename(report_name, variant_key)
+            future = futures.get((report_name, variant_key))
+            if future is None:
+                print(f"    ✓ Up to date, skipping: {filename}")
+            else:
+                print(future.result())
+                generated.append(filename)
+
+    summary = f' ✓ STAGE 4 COMPLETE: {len(generated)} PDF Reports Generated'
+    print(f"""
+{BAR}
+█{summary.center(78)}█
+{BAR}
+""")
+    if generated:
+        print("Generated Reports:")
+        print("\n".join(f"  • {filename}" for filename in generated))
+    skipped = len(jobs) - len(generated)
+    if skipped:
+        print(f"\n{skipped} report(s) already up to date")
 
 
 if __name__ == '__main__':
@@ -21,20 +21,23 @@ import matplotlib.pyplot as plt
 import numpy as np
 import os
 import sys
-import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from pathlib import Path
 
-# Setup
-sys.path.insert(0, '/Users/shivpat/seed-fund-tracking/scripts')
+# Setup: shared helpers live in analysis/scripts of this repository
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / 'analysis' / 'scripts'))
 
 from iwrc_brand_style import (
     IWRC_COLORS, configure_matplotlib_iwrc, apply_iwrc_matplotlib_style,
     add_logo_to_matplotlib_figure
 )
+from iwrc_data_loader import load_project_overview, extract_project_years, is_up_to_date, script_sources
 
 PROJECT_ROOT = '/Users/shivpat/seed-fund-tracking'
 DATA_FILE = os.path.join(PROJECT_ROOT, 'data/consolidated/IWRC Seed Fund Tracking.xlsx')
 OUTPUT_DIR = os.path.join(PROJECT_ROOT, 'FINAL_DELIVERABLES 2')
+STAGE2_DIR = os.path.join(OUTPUT_DIR, 'visualizations/static_breakdown')
 
 configure_matplotlib_iwrc()
 COLORS = IWRC_COLORS
@@ -50,8 +53,6 @@ def load_and_prepare_data():
     print("LOADING AND PREPARING DATA")
     print("=" * 80)
 
-    df = pd.read_excel(DATA_FILE, sheet_name='Project Overview')
-
     # Column mapping
     col_map = {
         'Project ID ': 'project_id',
@@ -65,38 +66,35 @@ def load_and_prepare_data():
         'Number of Undergraduate Students Supported by WRRA $': 'undergrad_students',
         'Number of Post Docs Supported by WRRA $': 'postdoc_students',
     }
+    df = load_project_overview(DATA_FILE, columns=list(col_map))
     df = df.rename(columns=col_map)
 
-    # Convert to numeric
-    for col in ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students']:
-        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-    df['award_amount'] = pd.to_numeric(df['award_amount'], errors='coerce').fillna(0)
+    # Convert to numeric (float32 is exact for student counts and ample for dollar amounts)
+    numeric_cols = ['phd_students', 'ms_students', 'undergrad_students', 'postdoc_students', 'award_amount']
+    df[numeric_cols] = df[numeric_cols].apply(pd.to_numeric, errors='coerce').fillna(0.0).astype('float32')
+
+    # Low-cardinality labels as categoricals: equality filters compare integer codes
+    df['award_type'] = df['award_type'].astype('category')
+    df['institution'] = df['institution'].astype('category')
 
     # Extract year
-    def extract_year(project_id):
-        if pd.isna(project_id):
-            return None
-        project_id_str = str(project_id).strip()
-        year_match = re.search(r'(20\d{2}|19\d{2})', project_id_str)
-        if year_match:
-            return int(year_match.group(1))
-        fy_match = re.search(r'FY(\d{2})', project_id_str, re.IGNORECASE)
-        if fy_match:
-            fy_year = int(fy_match.group(1))
-            return 2000 + fy_year if fy_year < 100 else fy_year
-        return None
-
-    df['project_year'] = df['project_id'].apply(extract_year)
+    df['project_year'] = extract_project_years(df['project_id'])
+
+    # Time period and track masks, computed once on plain NumPy arrays
+    year = df['project_year'].to_numpy(dtype='float64', na_value=np.nan)
+    in_10yr = (year >= 2015) & (year <= 2024)
+    in_5yr = (year >= 2020) & (year <= 2024)
+    is_104b = (df['award_type'] == 'Base Grant (104b)').to_numpy()
 
     # Time periods
-    df_10yr = df[df['project_year'].between(2015, 2024, inclusive='both')]
-    df_5yr = df[df['project_year'].between(2020, 2024, inclusive='both')]
+    df_10yr = df.loc[in_10yr]
+    df_5yr = df.loc[in_5yr]
 
     # Tracks
     all_10yr = df_10yr
     all_5yr = df_5yr
-    b104_10yr = df_10yr[df_10yr['award_type'] == 'Base Grant (104b)']
-    b104_5yr = df_5yr[df_5yr['award_type'] == 'Base Grant (104b)']
+    b104_10yr = df.loc[in_10yr & is_104b]
+    b104_5yr = df.loc[in_5yr & is_104b]
 
     print(f"✓ Data loaded and prepared")
     print(f"\nAll Projects: {all_10yr['project_id'].nunique()} (10yr), {all_5yr['project_id'].nunique()} (5yr)")
@@ -111,20 +109,21 @@ def load_and_prepare_data():
 
 def generate_track_comparison_chart(all_10yr, all_5yr, b104_10yr, b104_5yr):
     """Generate side-by-side comparison: All Projects vs 104B Only."""
+    output_path = os.path.join(STAGE2_DIR, 'track_comparison.png')
+
     periods = ['10-Year\n(2015-2024)', '5-Year\n(2020-2024)']
 
-    # Metrics
-    all_inv_10yr = all_10yr['award_amount'].sum()
-    all_inv_5yr = all_5yr['award_amount'].sum()
-    b104_inv_10yr = b104_10yr['award_amount'].sum()
-    b104_inv_5yr = b104_5yr['award_amount'].sum()
+    # Metrics - one groupby over the stacked (period, track) slices
+    keys = [('10yr', 'all'), ('5yr', 'all'), ('10yr', '104b'), ('5yr', '104b')]
+    stacked = pd.concat([all_10yr, all_5yr, b104_10yr, b104_5yr], keys=keys, names=['period', 'track'])
+    summary = (stacked.groupby(level=['period', 'track'])
+               .agg(inv=('award_amount', 'sum'), n=('project_id', 'nunique'))
+               .reindex(pd.MultiIndex.from_tuples(keys), fill_value=0))
 
-    all_projects_10yr = all_10yr['project_id'].nunique()
-    all_projects_5yr = all_5yr['project_id'].nunique()
-    b104_projects_10yr = b104_10yr['project_id'].nunique()
-    b104_projects_5yr = b104_5yr['project_id'].nunique()
+    all_inv_10yr, all_inv_5yr, b104_inv_10yr, b104_inv_5yr = summary['inv']
+    all_projects_10yr, all_projects_5yr, b104_projects_10yr, b104_projects_5yr = summary['n']
 
-    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 7))
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(14, 7), layout='constrained')
     fig.patch.set_facecolor('white')
 
     # Investment comparison
@@ -178,23 +177,24 @@ def generate_track_comparison_chart(all_10yr, all_5yr, b104_10yr, b104_5yr):
     fig.suptitle('Track Comparison: All Projects vs 104B Only', fontsize=14, fontweight='bold',
                  color=COLORS['dark_teal'], y=0.98)
 
-    plt.tight_layout()
     apply_iwrc_matplotlib_style(fig, None)
     add_logo_to_matplotlib_figure(fig, position='top-right', size=0.08)
 
-    output_path = os.path.join(OUTPUT_DIR, 'visualizations/static_breakdown', 'track_comparison.png')
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
     print(f"  ✓ Generated: track_comparison.png")
     plt.close(fig)
 
 
 def generate_award_type_breakdown(all_10yr):
     """Show funding breakdown by award type."""
-    award_breakdown = all_10yr.groupby('award_type')['award_amount'].sum().sort_values(ascending=False)
+    output_path = os.path.join(STAGE2_DIR, 'award_type_funding_breakdown.png')
+
+    award_breakdown = all_10yr.groupby('award_type', observed=True)['award_amount'].sum().sort_values(ascending=False)
     award_breakdown = award_breakdown[award_breakdown > 0]  # Remove NaN
 
-    fig, ax = plt.subplots(figsize=(12, 7))
+    fig, ax = plt.subplots(figsize=(12, 7), layout='constrained')
     fig.patch.set_facecolor('white')
     ax.set_facecolor(COLORS['background'])
 
@@ -219,9 +219,9 @@ def generate_award_type_breakdown(all_10yr):
     apply_iwrc_matplotlib_style(fig, ax)
     add_logo_to_matplotlib_figure(fig, position='top-right', size=0.10)
 
-    output_path = os.path.join(OUTPUT_DIR, 'visualizations/static_breakdown', 'award_type_funding_breakdown.png')
     os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches='tight', facecolor='white', edgecolor='none')
+    plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white', edgecolor='none',
+                pil_kwargs={'compress_level': 1})
     print(f"  ✓ Generated: award_type_funding_breakdown.png")
     plt.close(fig)
 
@@ -232,10 +232,32 @@ def generate_stage2_visualizations(all_10yr, all_5yr, b104_10yr, b104_5yr, df_10
     print("STAGE 2: GENERATING COMPARISON VISUALIZATIONS")
     print("=" * 80 + "\n")
 
-    generate_track_comparison_chart(all_10yr, all_5yr, b104_10yr, b104_5yr)
-    generate_award_type_breakdown(df_10yr)
-
-    print(f"\n✓ STAGE 2 COMPLETE: 2 comparison visualizations generated")
+    # Charts newer than the workbook, this script and the shared modules are
+    # skipped before any worker starts
+    track_cols = ['project_id', 'award_amount']
+    charts = [
+        ('track_comparison.png', generate_track_comparison_chart,
+         lambda: [d[track_cols].copy() for d in (all_10yr, all_5yr, b104_10yr, b104_5yr)]),
+        ('award_type_funding_breakdown.png', generate_award_type_breakdown,
+         lambda: [df_10yr[['award_type', 'award_amount']].copy()]),
+    ]
+    stale = []
+    for filename, generate_chart, chart_args in charts:
+        if is_up_to_date(os.path.join(STAGE2_DIR, filename), *script_sources(__file__, DATA_FILE)):
+            print(f"  ✓ Up to date, skipping: {filename}")
+        else:
+            stale.append((generate_chart, chart_args))
+
+    # The charts are independent and CPU-bound (render + PNG encode), so draw
+    # them in separate processes, shipping only the columns each one reads
+    if stale:
+        with ProcessPoolExecutor(max_workers=len(stale)) as pool:
+            futures = [pool.submit(generate_chart, *chart_args())
+                       for generate_chart, chart_args in stale]
+            for future in futures:
+                future.result()
+
+    print(f"\n✓ STAGE 2 COMPLETE: {len(stale)} comparison visualizations generated")
 
 
 def main():
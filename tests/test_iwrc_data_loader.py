@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Tests for the shared loading helpers in iwrc_data_loader
+
+These tests use small in-memory data and temporary workbooks, not the real
+tracking data:
+1. Project year extraction from Project IDs (including blank IDs in
+   IWRCDataLoader.load_master_data)
+2. Excel engine fallback (calamine -> openpyxl)
+3. Parquet cache of the Project Overview sheet
+4. Output freshness checks (is_up_to_date)
+
+Usage:
+    python3 tests/test_iwrc_data_loader.py
+"""
+
+import os
+import sys
+from pathlib import Path
+import tempfile
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from analysis.scripts.iwrc_data_loader import (
+    _HAS_PARQUET_ENGINE,
+    IWRCDataLoader,
+    extract_project_years,
+    is_up_to_date,
+    load_project_overview,
+    read_excel_sheet,
+    script_sources,
+    SHARED_MODULES,
+)
+
+
+def write_workbook(path, df, sheet_name='Project Overview'):
+    """Write df as the only sheet of an .xlsx workbook."""
+    df.to_excel(path, sheet_name=sheet_name, index=False)
+
+
+class TestExtractProjectYears(unittest.TestCase):
+    """Test year parsing from Project IDs"""
+
+    def test_four_digit_year(self):
+        """A 4-digit year anywhere in the ID is used"""
+        years = extract_project_years(pd.Series(['2015IL301B', 'IWRC-2020-03', ' 1998-01 ']))
+        self.assertEqual(years.tolist(), [2015, 2020, 1998])
+
+    def test_fiscal_year(self):
+        """FYxx IDs map to 20xx, case-insensitively"""
+        years = extract_project_years(pd.Series(['FY21-004', 'fy19_002']))
+        self.assertEqual(years.tolist(), [2021, 2019])
+
+    def test_four_digit_year_wins_over_fiscal_year(self):
+        """An ID with both patterns uses the 4-digit year"""
+        years = extract_project_years(pd.Series(['FY21-2019-01']))
+        self.assertEqual(years.tolist(), [2019])
+
+    def test_numeric_ids(self):
+        """Integer Project IDs (as read from Excel) are parsed too"""
+        years = extract_project_years(pd.Series([2016001, 'C-04'], dtype=object))
+        self.assertEqual(years.iloc[0], 2016)
+
+    def test_missing_and_non_matching_ids(self):
+        """NaN and IDs without a year give <NA> in an Int64 Series"""
+        years = extract_project_years(pd.Series(['C-04', np.nan, None, 'ABC']))
+        self.assertEqual(str(years.dtype), 'Int64')
+        self.assertTrue(years.isna().all())
+
+
+class TestBlankProjectIds(unittest.TestCase):
+    """Test that rows without a Project ID load with a missing year"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.loader = IWRCDataLoader(project_root=self.tmp.name)
+        self.loader.master_file.parent.mkdir(parents=True)
+        write_workbook(self.loader.master_file, pd.DataFrame({
+            'Project ID ': ['2016-001', None, 'FY18-002'],
+            'Academic Institution of PI': ['Illinois State University'] * 3,
+            'Award Amount Allocated ($) this must be filled in for all lines': [1000, 2000, 3000],
+            'Number of PhD Students Supported by WRRA $': [1, 0, 2],
+            'Number of MS Students Supported by WRRA $': [0, 1, 0],
+            'Number of Undergraduate Students Supported by WRRA $': [0, 0, 1],
+            'Number of Post Docs Supported by WRRA $': [0, 0, 0],
+        }))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_load_master_data_with_blank_id(self):
+        """A blank Project ID gives <NA> instead of raising"""
+        with self.assertWarns(UserWarning):
+            df = self.loader.load_master_data(deduplicate=False)
+        self.assertEqual(df['project_year'].tolist()[::2], [2016, 2018])
+        self.assertTrue(pd.isna(df['project_year'].iloc[1]))
+
+    def test_extract_year_handles_na(self):
+        """The scalar helper accepts None, NaN and pd.NA"""
+        for value in (None, np.nan, pd.NA):
+            self.assertIsNone(self.loader._extract_year(value))
+        self.assertEqual(self.loader._extract_year('FY16-XXX'), 2016)
+
+
+class TestReadExcelSheet(unittest.TestCase):
+    """Test the Excel engine fallback"""
+
+    def test_falls_back_to_openpyxl(self):
+        """Without python-calamine the sheet is read with openpyxl"""
+        expected = pd.DataFrame({'a': [1]})
+
+        def fake_read_excel(data_file, engine=None, **kwargs):
+            if engine == 'calamine':
+                raise ImportError("Missing optional dependency 'python-calamine'")
+            return expected
+
+        with mock.patch.object(pd, 'read_excel', side_effect=fake_read_excel) as read_excel:
+            result = read_excel_sheet('tracking.xlsx', 'Project Overview', usecols=['a'])
+
+        self.assertIs(result, expected)
+        engines = [call.kwargs['engine'] for call in read_excel.call_args_list]
+        self.assertEqual(engines, ['calamine', 'openpyxl'])
+        fallback = read_excel.call_args_list[-1].kwargs
+        self.assertEqual(fallback['sheet_name'], 'Project Overview')
+        self.assertEqual(fallback['usecols'], ['a'])
+        self.assertEqual(fallback['engine_kwargs'], {'read_only': True, 'data_only': True})
+
+
+@unittest.skipUnless(_HAS_PARQUET_ENGINE, "no Parquet engine installed")
+class TestProjectOverviewCache(unittest.TestCase):
+    """Test the mtime/size-keyed Parquet cache in load_project_overview"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.data_file = Path(self.tmp.name) / 'tracking.xlsx'
+        self.cache_dir = Path(self.tmp.name) / '.cache'
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_mixed_type_column_round_trips(self):
+        """A column mixing str and int IDs is cached and read back unchanged"""
+        write_workbook(self.data_file, pd.DataFrame({
+            'Project ID ': [2015001, 'C-04', '2020-IL103AIS'],
+            'Award Amount': [1000.0, 2500.5, 300.0],
+        }))
+
+        first = load_project_overview(self.data_file)
+        self.assertEqual(len(list(self.cache_dir.glob('*.parquet'))), 1,
+                         "The sheet should be cached on first load")
+
+        cached = load_project_overview(self.data_file)
+        pd.testing.assert_frame_equal(first, cached)
+        self.assertEqual(list(cached['Project ID ']), [2015001, 'C-04', '2020-IL103AIS'])
+
+    def test_mixed_award_column_keeps_numbers(self):
+        """Award amounts next to text rows come back as numbers that can be summed"""
+        write_workbook(self.data_file, pd.DataFrame({
+            'Institution': ['UIUC', 'UIUC', 'SIU', None],
+            'Award Amount': [1000.0, 2500.5, 300.0, 'Total'],
+        }))
+
+        for df in (load_project_overview(self.data_file), load_project_overview(self.data_file)):
+            self.assertEqual(df['Award Amount'].tolist()[:3], [1000.0, 2500.5, 300.0])
+            totals = df.dropna(subset=['Institution']).groupby('Institution')['Award Amount'].sum()
+            self.assertEqual(totals.to_dict(), {'SIU': 300.0, 'UIUC': 3500.5})
+
+    def test_cache_invalidated_on_mtime_change(self):
+        """A newer workbook replaces the cached copy instead of being ignored"""
+        write_workbook(self.data_file, pd.DataFrame({'Award Amount': [1000.0]}))
+        load_project_overview(self.data_file)
+
+        write_workbook(self.data_file, pd.DataFrame({'Award Amount': [2000.0, 3000.0]}))
+        mtime = self.data_file.stat().st_mtime + 10
+        os.utime(self.data_file, (mtime, mtime))
+
+        df = load_project_overview(self.data_file)
+        self.assertEqual(df['Award Amount'].tolist(), [2000.0, 3000.0])
+        caches = list(self.cache_dir.glob('*.parquet'))
+        self.assertEqual(len(caches), 1, "Stale caches should be removed")
+        self.assertIn(str(self.data_file.stat().st_mtime_ns), caches[0].name)
+
+    def test_cache_invalidated_on_same_second_rewrite(self):
+        """A rewrite within the same second is not served from the old cache"""
+        second = 1_700_000_000 * 10**9
+        write_workbook(self.data_file, pd.DataFrame({'Award Amount': [1000.0]}))
+        os.utime(self.data_file, ns=(second + 100, second + 100))
+        load_project_overview(self.data_file)
+
+        write_workbook(self.data_file, pd.DataFrame({'Award Amount': [2000.0]}))
+        os.utime(self.data_file, ns=(second + 900, second + 900))
+
+        df = load_project_overview(self.data_file)
+        self.assertEqual(df['Award Amount'].tolist(), [2000.0])
+
+    def test_columns_subset(self):
+        """Requested columns are returned from both the xlsx and cached loads"""
+        write_workbook(self.data_file, pd.DataFrame({'A': [1], 'B': [2], 'C': [3]}))
+        self.assertEqual(list(load_project_overview(self.data_file, columns=['C', 'A']).columns), ['C', 'A'])
+        self.assertEqual(list(load_project_overview(self.data_file, columns=['C', 'A']).columns), ['C', 'A'])
+
+
+class TestIsUpToDate(unittest.TestCase):
+    """Test output freshness checks"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.source = Path(self.tmp.name) / 'source.xlsx'
+        self.output = Path(self.tmp.name) / 'output.png'
+        self.source.touch()
+        os.utime(self.source, (1000, 1000))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_missing_output(self):
+        """A missing output always needs building"""
+        self.assertFalse(is_up_to_date(self.output, self.source))
+
+    def test_output_newer_than_sources(self):
+        """An output newer than every source is up to date"""
+        self.output.touch()
+        os.utime(self.output, (2000, 2000))
+        self.assertTrue(is_up_to_date(self.output, self.source))
+
+    def test_output_older_than_a_source(self):
+        """An output older than any source is stale"""
+        self.output.touch()
+        os.utime(self.output, (500, 500))
+        self.assertFalse(is_up_to_date(self.output, self.source))
+
+    def test_missing_source(self):
+        """A missing source counts as changed rather than raising"""
+        self.output.touch()
+        os.utime(self.output, (2000, 2000))
+        self.assertFalse(is_up_to_date(self.output, self.source, Path(self.tmp.name) / 'gone.py'))
+
+    def test_script_sources(self):
+        """A script's outputs depend on its data, itself and the shared modules"""
+        sources = script_sources('chart.py', self.source)
+        self.assertEqual(sources[:2], (self.source, 'chart.py'))
+        self.assertEqual(sources[2:], SHARED_MODULES)
+        self.assertTrue(all(module.exists() for module in SHARED_MODULES))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)